@@ -0,0 +1,34 @@
+"""Shared FastAPI dependencies for the routers.
+
+The guarded ``irrigation_agent`` import lives here so it runs exactly once
+per process, however many modules ask for the tools or config.
+"""
+import logging
+from functools import cache
+from typing import Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+def _load_tools() -> Tuple[bool, Any]:
+    """Import the irrigation agent tools once; return (available, config)."""
+    try:
+        import irrigation_agent.tools  # noqa: F401
+        from irrigation_agent.config import config
+        logger.info("Irrigation agent tools loaded successfully")
+        return True, config
+    except Exception as e:
+        logger.warning(f"Could not load irrigation agent tools: {e}")
+        logger.info("API will run in limited mode without irrigation tools")
+        return False, None
+
+
+def get_tools_available() -> bool:
+    """Whether the irrigation agent tools imported successfully."""
+    return _load_tools()[0]
+
+
+def get_config() -> Any:
+    """The irrigation agent config, or None when the tools are unavailable."""
+    return _load_tools()[1]
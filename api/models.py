@@ -1,19 +1,28 @@
 """Pydantic models for API requests and responses."""
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# Request bodies are read-only once parsed; unknown client fields are dropped
+_REQUEST_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class IrrigationRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     plant: str
     duration: int = 30
 
 
 class NotificationRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     message: str
     priority: str = "medium"
 
 
 class ChatRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     message: str
     history: Optional[list] = None
     session_id: Optional[str] = None
@@ -22,6 +31,8 @@ class ChatRequest(BaseModel):
 
 
 class CropQuery(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     commodity: str
     year: int
     state: Optional[str] = None
@@ -29,6 +40,8 @@ class CropQuery(BaseModel):
 
 class AdvisorRequest(BaseModel):
     """Request body for garden-level advisor using USDA context."""
+    model_config = _REQUEST_CONFIG
+
     commodity: str
     state: Optional[str] = None
     year: Optional[int] = None
@@ -36,6 +49,8 @@ class AdvisorRequest(BaseModel):
 
 
 class SeedGardenRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     name: str = "Demo Garden"
     personality: str = "neutral"
     latitude: float = 0.0
@@ -47,7 +62,17 @@ class SeedGardenRequest(BaseModel):
 
 
 class TTSRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     text: str
     voice_id: Optional[str] = None
     model_id: Optional[str] = None
     output_format: Optional[str] = None
+
+
+class WebSocketChatMessage(BaseModel):
+    """Client "chat" frame on the WebSocket; other frame fields are ignored."""
+    model_config = _REQUEST_CONFIG
+
+    message: str = ""
+    garden_id: Optional[str] = None
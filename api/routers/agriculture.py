@@ -10,7 +10,7 @@ router = APIRouter(prefix="/api/agriculture", tags=["Agriculture (USDA)"])
 
 
 @router.get("/yield")
-async def get_crop_yield(
+def get_crop_yield(
     commodity: str = Query(..., description="Commodity, e.g., CORN, WHEAT"),
     year: int = Query(..., ge=1900, le=2100),
     state: Optional[str] = Query(None, description="State alpha code, e.g., IA"),
@@ -30,7 +30,7 @@ async def get_crop_yield(
 
 
 @router.get("/area_planted")
-async def get_area_planted(
+def get_area_planted(
     commodity: str = Query(..., description="Commodity, e.g., CORN, WHEAT"),
     year: int = Query(..., ge=1900, le=2100),
     state: Optional[str] = Query(None, description="State alpha code, e.g., IA"),
@@ -50,7 +50,7 @@ async def get_area_planted(
 
 
 @router.get("/search")
-async def search_agriculture_data(
+def search_agriculture_data(
     commodity: Optional[str] = Query(None),
     year: Optional[int] = Query(None),
     state: Optional[str] = Query(None),
@@ -1,11 +1,13 @@
 """Audio endpoints for Text-to-Speech and Speech-to-Text."""
+import asyncio
 import logging
-from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request
 
+from api.dependencies import get_tools_available, get_config
 from api.models import TTSRequest, ChatRequest
+from api.utils import now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +21,7 @@ DEFAULT_AUDIO_FORMAT = "mp3_44100_128"
 
 
 @router.post("/audio/tts")
-async def text_to_speech(req: TTSRequest):
+def text_to_speech(req: TTSRequest):
     """Text-to-Speech using ElevenLabs. Returns base64 audio data."""
     try:
         try:
@@ -38,7 +40,7 @@ async def text_to_speech(req: TTSRequest):
                 "voice_id": req.voice_id or DEFAULT_VOICE_ID,
                 "model_id": req.model_id or DEFAULT_TTS_MODEL,
                 "format": req.output_format or DEFAULT_AUDIO_FORMAT,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
         except (ImportError, AttributeError, ValueError):
             from irrigation_agent.service.audio_service import tts_elevenlabs
@@ -66,17 +68,17 @@ async def speech_to_text(file: UploadFile = File(...)):
         # Prefer SDK service if available
         try:
             from irrigation_agent.service.stt_service import convert_audio_to_text
-            text = convert_audio_to_text(file_bytes)
+            text = await asyncio.to_thread(convert_audio_to_text, file_bytes)
             if not text:
                 raise ValueError("STT failed")
             return {
                 "status": "success",
                 "text": text,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
         except (ImportError, AttributeError, ValueError):
             from irrigation_agent.service.audio_service import stt_elevenlabs
-            result = stt_elevenlabs(file_bytes)
+            result = await asyncio.to_thread(stt_elevenlabs, file_bytes)
             if result.get("status") == "error":
                 raise HTTPException(status_code=400, detail=result.get("error"))
             return result
@@ -119,7 +121,7 @@ async def voice_garden_talk(
             audio_bytes = await file.read()
             from irrigation_agent.service.stt_service import convert_audio_to_text
 
-            transcript = convert_audio_to_text(audio_bytes)
+            transcript = await asyncio.to_thread(convert_audio_to_text, audio_bytes)
             if not transcript:
                 raise HTTPException(status_code=400, detail="STT failed or empty transcript")
             input_text = transcript
@@ -146,7 +148,9 @@ async def voice_garden_talk(
 
         # Run garden chat using existing endpoint logic
         chat_req = ChatRequest(message=input_text, history=history)
-        chat_result = await garden_chat(garden_id, chat_req)
+        chat_result = await garden_chat(
+            garden_id, chat_req, tools_available=get_tools_available(), config=get_config()
+        )
 
         if not isinstance(chat_result, dict) or not chat_result.get("garden_id"):
             raise HTTPException(status_code=500, detail="Chat processing failed")
@@ -159,14 +163,15 @@ async def voice_garden_talk(
             "modality": modality or ("audio" if file else "text"),
             "input_text": input_text,
             "chat": chat_result,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
 
         # Optional TTS of the agent response
         if (tts is None or bool(tts)) and response_text:
             try:
                 from irrigation_agent.service.tts_service import convert_text_to_speech
-                audio_b64 = convert_text_to_speech(
+                audio_b64 = await asyncio.to_thread(
+                    convert_text_to_speech,
                     response_text,
                     voice_id=voice_id or DEFAULT_VOICE_ID,
                     model_id=model_id or DEFAULT_TTS_MODEL,
@@ -190,7 +195,7 @@ async def voice_garden_talk(
 
 
 @router.get("/chat/{session_id}")
-async def get_chat_session(session_id: str):
+def get_chat_session(session_id: str):
     """Retrieve chat session history."""
     try:
         from irrigation_agent.service.firebase_service import get_session_messages
@@ -201,7 +206,7 @@ async def get_chat_session(session_id: str):
 
 
 @router.post("/chat")
-async def deprecated_chat(request: ChatRequest):
+def deprecated_chat(request: ChatRequest):
     """Deprecated: use garden-scoped chat endpoint."""
     raise HTTPException(
         status_code=400,
@@ -1,14 +1,18 @@
 """Modern garden endpoints (garden-level operations with personality)."""
 import os
+import asyncio
 import logging
 import json
 import random
 import uuid
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 
+from api.dependencies import get_tools_available, get_config
+from api.services.cache import invalidate_gardens_status
 from api.models import ChatRequest, AdvisorRequest, SeedGardenRequest
+from api.utils import now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +32,7 @@ def check_tools_available(tools_available: bool):
 
 
 @router.get("")
-async def get_all_gardens(tools_available: bool = True):
+def get_all_gardens(tools_available: bool = Depends(get_tools_available)):
     """Get all gardens with their metadata."""
     check_tools_available(tools_available)
     try:
@@ -41,7 +45,7 @@ async def get_all_gardens(tools_available: bool = True):
 
 
 @router.get("/status")
-async def get_all_gardens_status(tools_available: bool = True):
+def get_all_gardens_status(tools_available: bool = Depends(get_tools_available)):
     """Get status for ALL gardens and their plants."""
     check_tools_available(tools_available)
     try:
@@ -54,7 +58,7 @@ async def get_all_gardens_status(tools_available: bool = True):
 
 
 @router.get("/{garden_id}")
-async def get_garden_status(garden_id: str, tools_available: bool = True):
+def get_garden_status(garden_id: str, tools_available: bool = Depends(get_tools_available)):
     """Get status for a specific garden and all its plants."""
     check_tools_available(tools_available)
     try:
@@ -71,7 +75,7 @@ async def get_garden_status(garden_id: str, tools_available: bool = True):
 
 
 @router.get("/{garden_id}/plants/{plant_id}")
-async def get_plant_in_garden(garden_id: str, plant_id: str, tools_available: bool = True):
+def get_plant_in_garden(garden_id: str, plant_id: str, tools_available: bool = Depends(get_tools_available)):
     """Get detailed status for a specific plant in a garden."""
     check_tools_available(tools_available)
     try:
@@ -88,7 +92,7 @@ async def get_plant_in_garden(garden_id: str, plant_id: str, tools_available: bo
 
 
 @router.post("/{garden_id}/plants/{plant_id}/chat")
-async def chat_with_plant(garden_id: str, plant_id: str, request: ChatRequest):
+def chat_with_plant(garden_id: str, plant_id: str, request: ChatRequest):
     """Deprecated: garden has one sensor; chat is garden-scoped."""
     raise HTTPException(
         status_code=410,
@@ -97,12 +101,12 @@ async def chat_with_plant(garden_id: str, plant_id: str, request: ChatRequest):
 
 
 @router.get("/{garden_id}/weather")
-async def get_garden_weather(garden_id: str, tools_available: bool = True):
+async def get_garden_weather(garden_id: str, tools_available: bool = Depends(get_tools_available)):
     """Get weather forecast for a garden location using Google Weather API."""
     check_tools_available(tools_available)
     try:
         from irrigation_agent.tools import get_garden_weather
-        result = get_garden_weather(garden_id)
+        result = await asyncio.to_thread(get_garden_weather, garden_id)
         if result.get("status") == "error":
             raise HTTPException(status_code=404, detail=result.get("error"))
         return result
@@ -114,7 +118,7 @@ async def get_garden_weather(garden_id: str, tools_available: bool = True):
 
 
 @router.get("/{garden_id}/plants/{plant_id}/recommendation")
-async def get_irrigation_recommendation(garden_id: str, plant_id: str, tools_available: bool = True):
+def get_irrigation_recommendation(garden_id: str, plant_id: str, tools_available: bool = Depends(get_tools_available)):
     """Get irrigation recommendation with weather analysis for a specific plant."""
     check_tools_available(tools_available)
     try:
@@ -131,13 +135,13 @@ async def get_irrigation_recommendation(garden_id: str, plant_id: str, tools_ava
 
 
 @router.post("/{garden_id}/advisor")
-async def garden_advisor(garden_id: str, req: AdvisorRequest, tools_available: bool = True, config=None):
+async def garden_advisor(garden_id: str, req: AdvisorRequest, tools_available: bool = Depends(get_tools_available), config=Depends(get_config)):
     """Agent advisor for a garden combining local context with USDA Quick Stats."""
     check_tools_available(tools_available)
     try:
         from irrigation_agent.tools import get_garden_status, get_garden_weather
         from irrigation_agent.service.agriculture_service import get_crop_yield, get_area_planted
-        from irrigation_agent.utils.genai_utils import get_genai_client, extract_text, extract_json_object
+        from irrigation_agent.utils.genai_utils import get_genai_client, generate_content_async, extract_text, extract_json_object, prompt_json
         from irrigation_agent.config import config as app_config
         from prompts import GARDEN_ADVISOR_PROMPT
 
@@ -147,17 +151,18 @@ async def garden_advisor(garden_id: str, req: AdvisorRequest, tools_available: b
         client = get_genai_client()
 
         # Garden context
-        garden_data = get_garden_status(garden_id)
+        garden_data = await asyncio.to_thread(get_garden_status, garden_id)
         if garden_data.get("status") != "success":
             raise HTTPException(status_code=404, detail=garden_data.get("error", "Garden not found"))
 
-        # USDA context (optional fields)
+        # USDA context (optional fields) and weather context for the garden
+        # (optional if API not configured); independent blocking reads.
         year = req.year or datetime.now().year
-        usda_yield = get_crop_yield(req.commodity, year, req.state)
-        usda_area = get_area_planted(req.commodity, year, req.state)
-
-        # Weather context for the garden (optional if API not configured)
-        weather = get_garden_weather(garden_id)
+        usda_yield, usda_area, weather = await asyncio.gather(
+            asyncio.to_thread(get_crop_yield, req.commodity, year, req.state),
+            asyncio.to_thread(get_area_planted, req.commodity, year, req.state),
+            asyncio.to_thread(get_garden_weather, garden_id),
+        )
 
         personality = garden_data.get("personality", "neutral")
         garden_name = garden_data.get("garden_name", garden_id)
@@ -165,18 +170,19 @@ async def garden_advisor(garden_id: str, req: AdvisorRequest, tools_available: b
         context_prompt = GARDEN_ADVISOR_PROMPT.format(
             garden_name=garden_name,
             personality=personality,
-            garden_data=garden_data,
+            garden_data=prompt_json(garden_data),
             commodity=req.commodity,
             year=year,
             state=req.state or '-',
-            usda_yield=usda_yield,
-            usda_area=usda_area,
-            weather=weather,
+            usda_yield=prompt_json(usda_yield),
+            usda_area=prompt_json(usda_area),
+            weather=prompt_json(weather),
             user_message=req.user_message or '',
             weather_available=str(weather.get('status') == 'success').lower()
         )
 
-        response = client.models.generate_content(
+        response = await generate_content_async(
+            client,
             model=config.worker_model,
             contents=context_prompt
         )
@@ -190,7 +196,7 @@ async def garden_advisor(garden_id: str, req: AdvisorRequest, tools_available: b
                 "garden_id": garden_id,
                 "garden_name": garden_name,
                 "advisor": data,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
         except json.JSONDecodeError:
             return {
@@ -205,7 +211,7 @@ async def garden_advisor(garden_id: str, req: AdvisorRequest, tools_available: b
                     },
                     "priority": "info"
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
     except HTTPException:
         raise
@@ -215,7 +221,7 @@ async def garden_advisor(garden_id: str, req: AdvisorRequest, tools_available: b
 
 
 @router.post("/{garden_id}/seed")
-async def seed_garden(garden_id: str, req: SeedGardenRequest):
+def seed_garden(garden_id: str, req: SeedGardenRequest):
     """Seed or update a garden with plants in simulation/Firestore for testing."""
     try:
         from irrigation_agent.service.firebase_service import seed_garden
@@ -229,6 +235,7 @@ async def seed_garden(garden_id: str, req: SeedGardenRequest):
             base_moisture=req.base_moisture,
             history=req.history,
         )
+        invalidate_gardens_status()
         if result.get("status") != "success":
             raise HTTPException(status_code=400, detail=result.get("error", "Seed failed"))
         return result
@@ -240,11 +247,11 @@ async def seed_garden(garden_id: str, req: SeedGardenRequest):
 
 
 @router.post("/{garden_id}/chat")
-async def garden_chat(garden_id: str, request: ChatRequest, tools_available: bool = True, config=None):
+async def garden_chat(garden_id: str, request: ChatRequest, tools_available: bool = Depends(get_tools_available), config=Depends(get_config)):
     """Chat del asistente a nivel de jardin (incluye info de plantas como contexto)."""
     check_tools_available(tools_available)
     try:
-        from irrigation_agent.utils.genai_utils import get_genai_client, extract_text, extract_json_object
+        from irrigation_agent.utils.genai_utils import get_genai_client, generate_content_async, extract_text, extract_json_object, prompt_json
         from irrigation_agent.tools import get_garden_status
         from irrigation_agent.config import config as app_config
         from prompts import GARDEN_CHAT_PROMPT
@@ -253,14 +260,16 @@ async def garden_chat(garden_id: str, request: ChatRequest, tools_available: boo
             config = app_config
 
         client = get_genai_client()
-        garden_data = get_garden_status(garden_id)
+        garden_data = await asyncio.to_thread(get_garden_status, garden_id)
         if garden_data.get("status") != "success":
             raise HTTPException(status_code=404, detail=garden_data.get("error", "Garden not found"))
         personality = garden_data.get("personality", "neutral")
         garden_name = garden_data.get("garden_name", garden_id)
 
-        # Simulate a small data tick on each chat in simulation mode
-        _maybe_simulate_garden(garden_id)
+        # Simulate a small data tick on each chat in simulation mode. The reply
+        # is built from the status read above, so the writes run in the
+        # background instead of delaying it.
+        asyncio.get_running_loop().run_in_executor(None, _maybe_simulate_garden, garden_id)
 
         # Build garden type and recent history text (last 10)
         garden_type = garden_data.get("garden_type") or garden_data.get("plant_type", "unknown")
@@ -285,7 +294,7 @@ async def garden_chat(garden_id: str, request: ChatRequest, tools_available: boo
             garden_type=garden_type,
             garden_name=garden_name,
             personality=personality,
-            garden_data=garden_data,
+            garden_data=prompt_json(garden_data),
             history_text=history_text or 'N/A',
             message=request.message
         )
@@ -296,11 +305,12 @@ async def garden_chat(garden_id: str, request: ChatRequest, tools_available: boo
         # Log user turn into sessions (best-effort)
         try:
             from irrigation_agent.service.firebase_service import add_session_message
-            add_session_message(garden_id, "user", str(request.message), {"garden_name": garden_name}, session_id=session_id)
+            await asyncio.to_thread(add_session_message, garden_id, "user", str(request.message), {"garden_name": garden_name}, session_id=session_id)
         except Exception:
             pass
 
-        response = client.models.generate_content(
+        response = await generate_content_async(
+            client,
             model=config.worker_model,
             contents=context_prompt
         )
@@ -315,7 +325,7 @@ async def garden_chat(garden_id: str, request: ChatRequest, tools_available: boo
             _msg = str(response_data.get("message", response_text)).strip()
             try:
                 from irrigation_agent.service.firebase_service import add_session_message
-                add_session_message(garden_id, "assistant", _msg, {"garden_name": garden_name}, session_id=session_id)
+                await asyncio.to_thread(add_session_message, garden_id, "assistant", _msg, {"garden_name": garden_name}, session_id=session_id)
             except Exception:
                 pass
             result = {
@@ -327,13 +337,14 @@ async def garden_chat(garden_id: str, request: ChatRequest, tools_available: boo
                 "data": response_data.get("data", {}),
                 "suggestions": response_data.get("suggestions", []),
                 "priority": response_data.get("priority", "info"),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             # Optional TTS of assistant reply
             try:
                 if bool(request.include_audio) and _msg:
                     from irrigation_agent.service.tts_service import convert_text_to_speech
-                    audio_b64 = convert_text_to_speech(
+                    audio_b64 = await asyncio.to_thread(
+                        convert_text_to_speech,
                         _msg,
                         voice_id=DEFAULT_VOICE_ID,
                         model_id=DEFAULT_TTS_MODEL,
@@ -348,7 +359,7 @@ async def garden_chat(garden_id: str, request: ChatRequest, tools_available: boo
             _fallback_msg = response_text.strip()
             try:
                 from irrigation_agent.service.firebase_service import add_session_message
-                add_session_message(garden_id, "assistant", _fallback_msg, {"garden_name": garden_name}, session_id=session_id)
+                await asyncio.to_thread(add_session_message, garden_id, "assistant", _fallback_msg, {"garden_name": garden_name}, session_id=session_id)
             except Exception:
                 pass
             result = {
@@ -360,13 +371,14 @@ async def garden_chat(garden_id: str, request: ChatRequest, tools_available: boo
                 "data": {},
                 "suggestions": [],
                 "priority": "info",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             # Optional TTS of assistant reply
             try:
                 if bool(request.include_audio) and _fallback_msg:
                     from irrigation_agent.service.tts_service import convert_text_to_speech
-                    audio_b64 = convert_text_to_speech(
+                    audio_b64 = await asyncio.to_thread(
+                        convert_text_to_speech,
                         _fallback_msg,
                         voice_id=DEFAULT_VOICE_ID,
                         model_id=DEFAULT_TTS_MODEL,
@@ -391,13 +403,13 @@ async def garden_image_analyze(garden_id: str, file: UploadFile = File(...)):
     try:
         data = await file.read()
         content_type = file.content_type or "image/jpeg"
-        from irrigation_agent.service.image_service import analyze_plant_image, store_image_record
+        from irrigation_agent.service.image_service import analyze_plant_image_async, store_image_record
 
-        analysis = analyze_plant_image(data, content_type)
+        analysis = await analyze_plant_image_async(data, content_type)
         if analysis.get("status") != "success":
             raise HTTPException(status_code=400, detail=analysis.get("error", "analysis failed"))
 
-        store = store_image_record(garden_id, data, content_type, analysis.get("analysis", {}))
+        store = await asyncio.to_thread(store_image_record, garden_id, data, content_type, analysis.get("analysis", {}))
         if store.get("status") != "success":
             logger.warning(f"Image stored locally or failed: {store}")
 
@@ -406,7 +418,7 @@ async def garden_image_analyze(garden_id: str, file: UploadFile = File(...)):
             "garden_id": garden_id,
             "doc_id": store.get("doc_id"),
             "analysis": analysis.get("analysis"),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
     except HTTPException:
         raise
@@ -426,5 +438,6 @@ def _maybe_simulate_garden(garden_id: str) -> None:
             current = pdata.get('current_moisture') or 50
             new = max(0, min(100, int(current) + random.randint(-3, 3)))
             simulator.update_garden_plant_moisture(garden_id, pid, new)
+        invalidate_gardens_status()
     except Exception as e:
         logger.warning(f"Simulation update failed for garden {garden_id}: {e}")
@@ -1,8 +1,10 @@
 """Legacy plant endpoints (flat model, single plant operations)."""
 import logging
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from api.dependencies import get_tools_available
 from api.models import IrrigationRequest, NotificationRequest
+from api.services.cache import invalidate_gardens_status
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +18,7 @@ def check_tools_available(tools_available: bool):
 
 
 @router.get("/plant/{plant_name}/moisture")
-async def get_soil_moisture(plant_name: str, tools_available: bool):
+def get_soil_moisture(plant_name: str, tools_available: bool = Depends(get_tools_available)):
     """Get soil moisture for specific plant."""
     check_tools_available(tools_available)
     try:
@@ -29,10 +31,10 @@ async def get_soil_moisture(plant_name: str, tools_available: bool):
 
 
 @router.get("/plant/{plant_name}/history")
-async def get_sensor_history(
+def get_sensor_history(
     plant_name: str,
     hours: int = Query(default=24, ge=1, le=168),
-    tools_available: bool = True
+    tools_available: bool = Depends(get_tools_available)
 ):
     """Get historical sensor data for plant."""
     check_tools_available(tools_available)
@@ -46,7 +48,7 @@ async def get_sensor_history(
 
 
 @router.get("/plant/{plant_name}/health")
-async def get_plant_health(plant_name: str, tools_available: bool = True):
+def get_plant_health(plant_name: str, tools_available: bool = Depends(get_tools_available)):
     """Get plant health assessment."""
     check_tools_available(tools_available)
     try:
@@ -59,7 +61,7 @@ async def get_plant_health(plant_name: str, tools_available: bool = True):
 
 
 @router.get("/tank")
-async def get_tank_level(tools_available: bool = True):
+def get_tank_level(tools_available: bool = Depends(get_tools_available)):
     """Get water tank level."""
     check_tools_available(tools_available)
     try:
@@ -72,7 +74,7 @@ async def get_tank_level(tools_available: bool = True):
 
 
 @router.get("/weather")
-async def get_weather(days: int = Query(default=3, ge=1, le=7), tools_available: bool = True):
+def get_weather(days: int = Query(default=3, ge=1, le=7), tools_available: bool = Depends(get_tools_available)):
     """Get weather forecast."""
     check_tools_available(tools_available)
     try:
@@ -85,12 +87,13 @@ async def get_weather(days: int = Query(default=3, ge=1, le=7), tools_available:
 
 
 @router.post("/irrigate")
-async def trigger_irrigation_endpoint(request: IrrigationRequest, tools_available: bool = True):
+def trigger_irrigation_endpoint(request: IrrigationRequest, tools_available: bool = Depends(get_tools_available)):
     """Trigger irrigation for a plant."""
     check_tools_available(tools_available)
     try:
         from irrigation_agent.tools import trigger_irrigation
         result = trigger_irrigation(request.plant, request.duration)
+        invalidate_gardens_status()
         return result
     except Exception as e:
         logger.error(f"Error triggering irrigation: {e}")
@@ -98,7 +101,7 @@ async def trigger_irrigation_endpoint(request: IrrigationRequest, tools_availabl
 
 
 @router.post("/notify")
-async def send_notification_endpoint(request: NotificationRequest, tools_available: bool = True):
+def send_notification_endpoint(request: NotificationRequest, tools_available: bool = Depends(get_tools_available)):
     """Send notification."""
     check_tools_available(tools_available)
     try:
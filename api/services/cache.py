@@ -0,0 +1,99 @@
+"""Short-lived async caches for reads shared by the HTTP, WebSocket and monitoring paths."""
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+
+from api.utils import is_success
+
+
+class AsyncTTLCache:
+    """Single-flight TTL cache around a blocking zero-argument fetch.
+
+    The fetch runs in a worker thread. Callers arriving while it is in flight
+    share its outcome, error results and exceptions included, so a burst of
+    requests costs one upstream read even when that read fails; ``cache_if``
+    only decides whether later callers reuse the value.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Any],
+        ttl_seconds: float,
+        cache_if: Optional[Callable[[Any], bool]] = None,
+    ):
+        self._fetch = fetch
+        self._ttl = ttl_seconds
+        self._cache_if = cache_if
+        self._value: Any = None
+        self._expires = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+        self._generation = 0
+
+    async def get(self) -> Any:
+        if time.monotonic() < self._expires:
+            return self._value
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._refresh())
+        # Shielded so one caller giving up doesn't cancel the read for the rest
+        return await asyncio.shield(self._inflight)
+
+    async def _refresh(self) -> Any:
+        generation = self._generation
+        try:
+            value = await asyncio.to_thread(self._fetch)
+            # A clear() during the read means it may predate a write; don't keep it
+            if generation == self._generation and (self._cache_if is None or self._cache_if(value)):
+                self._value = value
+                self._expires = time.monotonic() + self._ttl
+            return value
+        finally:
+            if self._inflight is asyncio.current_task():
+                self._inflight = None
+
+    def clear(self) -> None:
+        self._value = None
+        self._expires = 0.0
+        self._generation += 1
+        # Later callers start a fresh read instead of joining the stale one
+        self._inflight = None
+
+
+def _fetch_system_status() -> Dict[str, Any]:
+    from irrigation_agent.tools import get_system_status
+    return get_system_status()
+
+
+def _fetch_all_gardens_status() -> Dict[str, Any]:
+    from irrigation_agent.tools import get_all_gardens_status
+    return get_all_gardens_status()
+
+
+STATUS_CACHE_TTL_SECONDS = float(os.getenv("STATUS_CACHE_TTL_SECONDS", "5"))
+GARDENS_STATUS_CACHE_TTL_SECONDS = float(os.getenv("GARDENS_STATUS_CACHE_TTL_SECONDS", "5"))
+
+_status_cache = AsyncTTLCache(_fetch_system_status, STATUS_CACHE_TTL_SECONDS, cache_if=is_success)
+_gardens_status_cache = AsyncTTLCache(
+    _fetch_all_gardens_status, GARDENS_STATUS_CACHE_TTL_SECONDS, cache_if=is_success
+)
+
+
+async def get_cached_status() -> Dict[str, Any]:
+    """``get_system_status()`` shared across callers for a few seconds.
+
+    Callers must not mutate the returned dict.
+    """
+    return await _status_cache.get()
+
+
+async def get_cached_gardens_status() -> Dict[str, Any]:
+    """``get_all_gardens_status()`` shared by the monitor loop and manual triggers.
+
+    Callers must not mutate the returned dict.
+    """
+    return await _gardens_status_cache.get()
+
+
+def invalidate_gardens_status() -> None:
+    """Drop the cached garden sweep after a write that changes plant state."""
+    _gardens_status_cache.clear()
@@ -2,10 +2,86 @@
 import os
 import logging
 import asyncio
+import time
+import zlib
 from datetime import datetime
+from functools import cache
+from typing import Dict, List, Optional, Tuple
+
+from api.services.cache import get_cached_gardens_status, invalidate_gardens_status
+from api.utils import now_iso
 
 logger = logging.getLogger(__name__)
 
+# Resolved once here rather than on every agent call; without the irrigation
+# tools (limited mode) the agent paths return before touching these.
+try:
+    from irrigation_agent.utils.genai_utils import get_genai_client, generate_json_text_async, extract_json_object, prompt_json
+    from prompts import AGENT_SYSTEM_PROMPT, AGENT_DECISION_PROMPT, AGENT_BATCH_DECISION_PROMPT
+except Exception as e:
+    logger.warning(f"Agent analysis unavailable: {e}")
+
+# Same for the tools and notifiers used on every tick / decision
+try:
+    from irrigation_agent.tools import trigger_irrigation, check_water_tank_level
+    from irrigation_agent.config import config as app_config, notification_config
+except Exception as e:
+    logger.warning(f"Irrigation tools unavailable for monitoring: {e}")
+
+try:
+    from irrigation_agent.service.telegram_service import send_agent_decision_notification, send_moisture_alert
+except Exception as e:
+    logger.warning(f"Telegram notifications unavailable for monitoring: {e}")
+
+# Soil moisture (%) below which a plant gets an agent decision / a warning
+CRIT_MOISTURE = 30
+WARN_MOISTURE = 45
+_SEVERITY_LABELS = {True: ("critical", "Humedad critica"), False: ("warning", "Humedad baja")}
+
+# Below this the agent is consulted even with nobody listening, since its
+# decision may irrigate on its own
+AUTO_ACT_MOISTURE = 20
+
+# Critical plants are decided by rule, without the model, when the tank is at
+# or below this level (%) or the plant was watered within the window
+TANK_EMPTY_PERCENT = 5
+RECENT_IRRIGATION_SECONDS = 3600
+
+# Upper bound on plants per batched agent call, to keep prompts and replies small
+AGENT_BATCH_MAX_PLANTS = 20
+
+# Concurrent agent model calls, shared by monitor ticks and manual triggers;
+# rate-limited (429) calls back off exponentially from AGENT_RETRY_BASE_SECONDS
+AGENT_MAX_CONCURRENCY = int(os.getenv("AGENT_MAX_CONCURRENCY", "8"))
+AGENT_RETRY_BASE_SECONDS = 1.0
+_agent_sem = asyncio.Semaphore(AGENT_MAX_CONCURRENCY)
+
+# Model decisions are reused for the same plant/situation (moisture in 5-point
+# buckets) for this long, so a persisting alert doesn't re-query every tick.
+# Decisions that actuate (see _ACTUATING_DECISIONS) are never reused
+AGENT_DECISION_TTL_SECONDS = float(os.getenv("AGENT_DECISION_TTL_SECONDS", "300"))
+_DECISION_CACHE_MAX = 512
+_decision_cache: Dict[tuple, Tuple[float, dict]] = {}
+_ACTUATING_DECISIONS = {"regar"}
+
+# A plant that stays at the same alert severity is re-notified (broadcast,
+# Telegram, agent) at most once per window; 0 disables the debounce
+ALERT_DEBOUNCE_SECONDS = float(os.getenv("ALERT_DEBOUNCE_SECONDS", "300"))
+_last_alert: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+# Gardens are split across this many independent monitor loops, so a slow
+# agent call for one garden only delays the next tick of its own shard
+MONITOR_SHARDS = max(1, int(os.getenv("MONITOR_SHARDS", "4")))
+
+# Communication style per garden personality for agent decisions
+PERSONALITY_STYLES = {
+    "friendly": "Usa un tono amigable, carinoso y cercano. Habla como un amigo que cuida sus plantas con amor.",
+    "professional": "Usa un tono profesional, tecnico y preciso. Proporciona datos y recomendaciones basadas en mejores practicas.",
+    "playful": "Usa un tono divertido, creativo y alegre. Haz que el cuidado de plantas sea entretenido.",
+    "caring": "Usa un tono compasivo y maternal. Muestra preocupacion genuina por el bienestar de las plantas.",
+    "neutral": "Usa un tono informativo y objetivo. Proporciona hechos sin agregar emociones."
+}
+
 
 async def agent_analyze_and_act(condition: str, data: dict, tools_available: bool, config) -> dict:
     """
@@ -27,42 +103,23 @@ async def agent_analyze_and_act(condition: str, data: dict, tools_available: boo
             "actions": []
         }
 
-    try:
-        from irrigation_agent.utils.genai_utils import get_genai_client, extract_text, extract_json_object
-        from irrigation_agent.tools import trigger_irrigation
-        from prompts import AGENT_DECISION_PROMPT
-
-        client = get_genai_client()
+    known = _fast_decision(condition, data) or _cached_decision(condition, data)
+    if known is not None:
+        return await asyncio.to_thread(_apply_decision, known, data)
 
+    try:
         # Extract garden personality from data
         personality = data.get("personality", "professional")
         garden_name = data.get("garden_name", "el jardin")
 
-        # Build personality-based communication style
-        personality_styles = {
-            "friendly": "Usa un tono amigable, carinoso y cercano. Habla como un amigo que cuida sus plantas con amor.",
-            "professional": "Usa un tono profesional, tecnico y preciso. Proporciona datos y recomendaciones basadas en mejores practicas.",
-            "playful": "Usa un tono divertido, creativo y alegre. Haz que el cuidado de plantas sea entretenido.",
-            "caring": "Usa un tono compasivo y maternal. Muestra preocupacion genuina por el bienestar de las plantas.",
-            "neutral": "Usa un tono informativo y objetivo. Proporciona hechos sin agregar emociones."
-        }
-        style_instruction = personality_styles.get(personality, personality_styles["neutral"])
-
         prompt = AGENT_DECISION_PROMPT.format(
             garden_name=garden_name,
             personality=personality,
-            style_instruction=style_instruction,
             condition=condition,
-            data=data
-        )
-
-        response = client.models.generate_content(
-            model=config.worker_model,
-            contents=prompt
+            data=prompt_json(data)
         )
 
-        # Extract response text
-        response_text = extract_text(response)
+        response_text = await _generate_decision(config, prompt)
 
         # Try to parse JSON from response
         decision_obj, raw_text = extract_json_object(response_text)
@@ -75,43 +132,8 @@ async def agent_analyze_and_act(condition: str, data: dict, tools_available: boo
         else:
             decision = decision_obj
 
-        # Execute actions based on decision
-        actions_taken = []
-        if decision.get("decision") == "regar" and decision.get("plant_id"):
-            try:
-                duration = decision.get("action_params", {}).get("duration", 30)
-                result = trigger_irrigation(decision["plant_id"], duration)
-                actions_taken.append({
-                    "type": "irrigation",
-                    "plant": decision["plant_id"],
-                    "duration": duration,
-                    "result": result
-                })
-            except Exception as e:
-                logger.error(f"Error executing irrigation: {e}")
-                actions_taken.append({
-                    "type": "irrigation",
-                    "error": str(e)
-                })
-
-        decision["actions_taken"] = actions_taken
-        decision["timestamp"] = datetime.now().isoformat()
-
-        # Send Telegram notification for agent decisions
-        try:
-            from irrigation_agent.service.telegram_service import send_agent_decision_notification
-            send_agent_decision_notification(
-                garden_name=garden_name,
-                plant_name=data.get("plant_name", decision.get("plant_id", "Unknown")),
-                decision=decision.get("decision", "unknown"),
-                explanation=decision.get("explanation", ""),
-                moisture=data.get("moisture", 0),
-                priority=decision.get("priority", "medium")
-            )
-        except Exception as telegram_err:
-            logger.warning(f"Failed to send Telegram notification: {telegram_err}")
-
-        return decision
+        _remember_decision(condition, data, decision)
+        return await asyncio.to_thread(_apply_decision, decision, data)
 
     except Exception as e:
         logger.error(f"Error in agent analysis: {e}")
@@ -119,10 +141,318 @@ async def agent_analyze_and_act(condition: str, data: dict, tools_available: boo
             "decision": "error",
             "explanation": f"Error al analizar: {str(e)}",
             "actions": [],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
 
+def _fast_decision(condition: str, data: dict) -> Optional[dict]:
+    """Deterministic decision for a critical plant the model can't improve on.
+
+    Watering is impossible with an empty tank and pointless right after a
+    previous watering; everything else is left to the model.
+    """
+    moisture = data.get("moisture")
+    if moisture is None or moisture >= CRIT_MOISTURE:
+        return None
+    tank_level = data.get("tank_level")
+    if tank_level is not None and tank_level <= TANK_EMPTY_PERCENT:
+        return {
+            "decision": "alerta",
+            "plant_id": data.get("plant_id"),
+            "garden_id": data.get("garden_id"),
+            "action_params": {},
+            "explanation": f"Humedad critica ({moisture}%) pero el tanque de agua esta vacio ({tank_level}%). Rellena el tanque para poder regar.",
+            "priority": "high"
+        }
+    age = _seconds_since(data.get("last_irrigation"))
+    if age is not None and age < RECENT_IRRIGATION_SECONDS:
+        return {
+            "decision": "esperar",
+            "plant_id": data.get("plant_id"),
+            "garden_id": data.get("garden_id"),
+            "action_params": {},
+            "explanation": f"Humedad critica ({moisture}%), pero la planta se rego hace {int(age // 60)} minutos. Esperando a que el agua se absorba antes de volver a regar.",
+            "priority": "medium"
+        }
+    return None
+
+
+def _seconds_since(value) -> Optional[float]:
+    """Age in seconds of an ISO string or datetime, or None if unparseable."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return (datetime.now(value.tzinfo) - value).total_seconds()
+
+
+def _tank_level(tank: dict) -> Optional[float]:
+    """Tank level (%) from check_water_tank_level, or None if unknown."""
+    # A missing tank document reads as 0% of 0 liters; that isn't "empty"
+    if tank.get("status") != "success" or not tank.get("capacity_liters"):
+        return None
+    return tank.get("level_percentage")
+
+
+def _decision_key(condition: str, data: dict) -> tuple:
+    return (
+        condition,
+        data.get("garden_id"),
+        data.get("plant_id"),
+        int((data.get("moisture") or 0) // 5),
+        data.get("personality"),
+    )
+
+
+def _cached_decision(condition: str, data: dict) -> Optional[dict]:
+    """A fresh copy of the model's last decision for this situation, if still valid."""
+    entry = _decision_cache.get(_decision_key(condition, data))
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return dict(entry[1])
+
+
+def _remember_decision(condition: str, data: dict, decision: dict) -> None:
+    """Store a model decision before _apply_decision stamps its actions and time.
+
+    A replayed decision is applied again, so an irrigation decision is not
+    stored: each one must come from a fresh model call.
+    """
+    if decision.get("decision") in _ACTUATING_DECISIONS:
+        return
+    key = _decision_key(condition, data)
+    _decision_cache.pop(key, None)
+    _decision_cache[key] = (time.monotonic() + AGENT_DECISION_TTL_SECONDS, dict(decision))
+    while len(_decision_cache) > _DECISION_CACHE_MAX:
+        del _decision_cache[next(iter(_decision_cache))]
+
+
+@cache
+def _agent_system_instruction() -> str:
+    """Static prefix of every agent call: role, all personality styles, schema.
+
+    Sent as the system instruction, it is byte-identical across calls and
+    gardens, so the model's prefix caching applies.
+    """
+    return AGENT_SYSTEM_PROMPT.format(
+        styles="\n".join(f"- {name}: {style}" for name, style in PERSONALITY_STYLES.items())
+    )
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return getattr(error, "code", None) == 429 or getattr(error, "status_code", None) == 429
+
+
+async def _generate_decision(config, prompt: str) -> str:
+    """Agent model reply text, bounded by AGENT_MAX_CONCURRENCY and retried on 429.
+
+    The reply is streamed and cut off once its JSON object is complete.
+    """
+    attempts = max(1, getattr(config, "max_retry_attempts", 3))
+    for attempt in range(attempts):
+        try:
+            async with _agent_sem:
+                return await generate_json_text_async(
+                    get_genai_client(),
+                    model=config.worker_model,
+                    contents=prompt,
+                    config={"system_instruction": _agent_system_instruction()}
+                )
+        except Exception as e:
+            if attempt + 1 >= attempts or not _is_rate_limited(e):
+                raise
+            delay = AGENT_RETRY_BASE_SECONDS * 2 ** attempt
+            logger.warning(f"Agent model rate limited, retrying in {delay:g}s")
+            await asyncio.sleep(delay)
+
+
+def _apply_decision(decision: dict, data: dict) -> dict:
+    """Carry out an agent decision for one plant and notify about it."""
+    # Execute actions based on decision
+    actions_taken = []
+    if decision.get("decision") == "regar" and decision.get("plant_id"):
+        try:
+            duration = decision.get("action_params", {}).get("duration", 30)
+            result = trigger_irrigation(decision["plant_id"], duration)
+            invalidate_gardens_status()
+            actions_taken.append({
+                "type": "irrigation",
+                "plant": decision["plant_id"],
+                "duration": duration,
+                "result": result
+            })
+        except Exception as e:
+            logger.error(f"Error executing irrigation: {e}")
+            actions_taken.append({
+                "type": "irrigation",
+                "error": str(e)
+            })
+
+    decision["actions_taken"] = actions_taken
+    decision["timestamp"] = now_iso()
+
+    # Send Telegram notification for agent decisions
+    try:
+        send_agent_decision_notification(
+            garden_name=data.get("garden_name", "el jardin"),
+            plant_name=data.get("plant_name", decision.get("plant_id", "Unknown")),
+            decision=decision.get("decision", "unknown"),
+            explanation=decision.get("explanation", ""),
+            moisture=data.get("moisture", 0),
+            priority=decision.get("priority", "medium")
+        )
+    except Exception as telegram_err:
+        logger.warning(f"Failed to send Telegram notification: {telegram_err}")
+
+    return decision
+
+
+async def agent_analyze_and_act_batch(
+    items: List[Tuple[str, dict]], tools_available: bool, config
+) -> List[dict]:
+    """
+    Decide for several plants of the same garden with one agent call per chunk.
+
+    Args:
+        items: (condition, data) pairs as taken by agent_analyze_and_act; all
+            entries share the garden_name/personality of the first one
+        tools_available: Whether irrigation tools are available
+        config: Configuration object
+
+    Returns:
+        One decision per item, in order. Plants with a rule-based or cached
+        decision skip the model; plants the model skipped, or whole chunks whose reply
+        can't be parsed, fall back to individual calls.
+    """
+    hits = {}
+    if tools_available:
+        for i, (condition, data) in enumerate(items):
+            known = _fast_decision(condition, data) or _cached_decision(condition, data)
+            if known is not None:
+                hits[i] = known
+    misses = [item for i, item in enumerate(items) if i not in hits]
+    chunks = [misses[i:i + AGENT_BATCH_MAX_PLANTS] for i in range(0, len(misses), AGENT_BATCH_MAX_PLANTS)]
+
+    # Model calls and the replay of known decisions all run concurrently
+    results = await asyncio.gather(
+        *(_analyze_chunk(chunk, tools_available, config) for chunk in chunks),
+        *(asyncio.to_thread(_apply_decision, hits[i], items[i][1]) for i in hits),
+    )
+    fresh = iter([decision for chunk_result in results[:len(chunks)] for decision in chunk_result])
+    decisions = dict(zip(hits, results[len(chunks):]))
+    return [decisions[i] if i in decisions else next(fresh) for i in range(len(items))]
+
+
+async def _analyze_chunk(items: List[Tuple[str, dict]], tools_available: bool, config) -> List[dict]:
+    if not tools_available or len(items) == 1:
+        return list(await asyncio.gather(*(agent_analyze_and_act(c, d, tools_available, config) for c, d in items)))
+
+    # Replies are matched to items by their row number, falling back to plant_id
+    by_index = {}
+    try:
+        data = items[0][1]
+        personality = data.get("personality", "professional")
+        prompt = AGENT_BATCH_DECISION_PROMPT.format(
+            garden_name=data.get("garden_name", "el jardin"),
+            personality=personality,
+            plants="\n".join(
+                f"{n}. {condition}\n   DATOS: {prompt_json(plant_data)}"
+                for n, (condition, plant_data) in enumerate(items, 1)
+            )
+        )
+
+        batch_obj, _ = extract_json_object(await _generate_decision(config, prompt))
+        if batch_obj is not None:
+            rows = {str(data.get("plant_id")): i for i, (_, data) in enumerate(items)}
+            for decision in batch_obj.get("decisions") or []:
+                if not isinstance(decision, dict):
+                    continue
+                i = _row_index(decision.get("index"), len(items))
+                if i is None:
+                    i = rows.get(str(decision.get("plant_id")))
+                if i is not None:
+                    by_index.setdefault(i, decision)
+    except Exception as e:
+        logger.error(f"Error in batched agent analysis: {e}")
+
+    # Plants the batch didn't cover are retried individually, concurrently
+    missing = [i for i in range(len(items)) if i not in by_index]
+    retried = await asyncio.gather(*(
+        agent_analyze_and_act(items[i][0], items[i][1], tools_available, config) for i in missing
+    ))
+    decisions = dict(zip(missing, retried))
+
+    for i, (condition, data) in enumerate(items):
+        if i in decisions:
+            continue
+        try:
+            decision = by_index[i]
+            # The row, not the echoed id, decides which plant is acted on
+            decision["plant_id"] = data.get("plant_id")
+            _remember_decision(condition, data, decision)
+            decisions[i] = await asyncio.to_thread(_apply_decision, decision, data)
+        except Exception as e:
+            logger.error(f"Error in agent analysis: {e}")
+            decisions[i] = {
+                "decision": "error",
+                "explanation": f"Error al analizar: {str(e)}",
+                "actions": [],
+                "timestamp": now_iso()
+            }
+    return [decisions[i] for i in range(len(items))]
+
+
+def _row_index(value, count: int) -> Optional[int]:
+    """0-based item index for a 1-based row number from the model, if valid."""
+    try:
+        i = int(value) - 1
+    except (TypeError, ValueError):
+        return None
+    return i if 0 <= i < count else None
+
+
+def _low_moisture_alert(
+    garden_id: str, garden_name: str, plant_id: str, plant_data: dict, moisture: float, is_critical: bool
+) -> dict:
+    severity, label = _SEVERITY_LABELS[is_critical]
+    return {
+        "type": "low_moisture",
+        "severity": severity,
+        "garden_id": garden_id,
+        "garden_name": garden_name,
+        "plant_id": plant_id,
+        "plant_name": plant_data.get("name", plant_id),
+        "moisture": moisture,
+        "message": f"[{garden_name}] {label} en {plant_id}: {moisture}%"
+    }
+
+
+def _debounced(garden_id: str, plant_id: str, severity: str, now: float) -> bool:
+    """Whether this alert repeats one fired within the window; records it if not."""
+    last = _last_alert.get((garden_id, plant_id))
+    if last is not None and last[0] == severity and now - last[1] < ALERT_DEBOUNCE_SECONDS:
+        return True
+    _last_alert[(garden_id, plant_id)] = (severity, now)
+    return False
+
+
+def _should_auto_act(alert: dict) -> bool:
+    return alert["moisture"] < AUTO_ACT_MOISTURE
+
+
+def _has_listeners(manager) -> bool:
+    """Whether an agent decision would reach anyone (WebSocket or Telegram)."""
+    if manager.active_connections:
+        return True
+    try:
+        return notification_config.has_telegram
+    except Exception:
+        return False
+
+
 async def process_garden_monitoring(garden_id: str, garden_data: dict, manager, tools_available: bool, config, collect_results: bool = False):
     """
     Process monitoring for a single garden. Returns alerts and decisions if collect_results=True.
@@ -144,91 +474,108 @@ async def process_garden_monitoring(garden_id: str, garden_data: dict, manager,
     garden_name = garden_data.get("garden_name", garden_id)
     personality = garden_data.get("personality", "neutral")
     alerts = []
-    decisions = []
-
-    for plant_id, plant_data in garden_data.get("plant_status", {}).items():
-        moisture = plant_data.get("moisture")
-        if moisture is None:
+    critical = []
+    warnings = []
+    # Warnings carry the time of the reading they're based on: the sweep
+    # stamps every garden once, so there is nothing to format here
+    scan_ts = garden_data.get("timestamp") or now_iso()
+
+    # Single filtering pass; most plants are fine and never reach the loop body
+    dry = [
+        (plant_id, plant_data, moisture)
+        for plant_id, plant_data in garden_data.get("plant_status", {}).items()
+        if (moisture := plant_data.get("moisture")) is not None and moisture < WARN_MOISTURE
+    ]
+
+    # Plants that recovered fire again as soon as they dry out
+    dry_ids = {plant_id for plant_id, _, _ in dry}
+    for key in [key for key in _last_alert if key[0] == garden_id and key[1] not in dry_ids]:
+        del _last_alert[key]
+    now = time.monotonic()
+
+    for plant_id, plant_data, moisture in dry:
+        is_critical = moisture < CRIT_MOISTURE
+        alert = _low_moisture_alert(garden_id, garden_name, plant_id, plant_data, moisture, is_critical)
+        alerts.append(alert)
+        # Manual triggers report everything; ticks skip repeats
+        if not collect_results and _debounced(garden_id, plant_id, alert["severity"], now):
             continue
 
-        if moisture < 30:
-            alert = {
-                "type": "low_moisture",
-                "severity": "critical",
-                "garden_id": garden_id,
-                "garden_name": garden_name,
-                "plant_id": plant_id,
-                "plant_name": plant_data.get("name", plant_id),
-                "moisture": moisture,
-                "message": f"[{garden_name}] Humedad critica en {plant_id}: {moisture}%"
-            }
-            if collect_results:
-                alerts.append(alert)
-
-            decision = await agent_analyze_and_act(
-                f"Humedad critica detectada en planta {plant_id} del jardin {garden_name}",
-                {
-                    "garden_id": garden_id,
-                    "garden_name": garden_name,
-                    "personality": personality,
-                    "plant_id": plant_id,
-                    "plant_name": plant_data.get("name", plant_id),
-                    "moisture": moisture,
-                    "threshold": 30,
-                    "last_irrigation": plant_data.get("last_irrigation")
-                },
-                tools_available,
-                config
+        (critical if is_critical else warnings).append((plant_id, plant_data, alert))
+
+    async def notify_warning(plant_id: str, plant_data: dict, alert: dict) -> None:
+        # Send Telegram alert for low moisture warnings
+        try:
+            await asyncio.to_thread(
+                send_moisture_alert,
+                garden_name=garden_name,
+                plant_name=plant_data.get("name", plant_id),
+                moisture=alert["moisture"],
+                severity="warning"
             )
-            if collect_results:
-                decisions.append(decision)
+        except Exception as telegram_err:
+            logger.warning(f"Failed to send Telegram moisture alert: {telegram_err}")
+
+        await manager.broadcast({
+            "type": "alert",
+            "garden_id": garden_id,
+            "garden_name": garden_name,
+            "personality": personality,
+            "alert": alert,
+            "timestamp": scan_ts
+        })
+
+    # Warnings are independent of each other; notify them concurrently
+    await asyncio.gather(*(notify_warning(*warning) for warning in warnings))
+
+    # Nobody would see the decision: only consult the agent where it may act
+    if critical and not collect_results and not _has_listeners(manager):
+        critical = [c for c in critical if _should_auto_act(c[2])]
+
+    # One tank read per garden lets obvious cases skip the model
+    tank_level = None
+    if critical and tools_available:
+        try:
+            tank_level = _tank_level(await asyncio.to_thread(check_water_tank_level))
+        except Exception as e:
+            logger.warning(f"Could not read tank level for agent decisions: {e}")
 
-            await manager.broadcast({
-                "type": "agent_decision",
+    # All critical plants of the garden go to the agent in one batched call
+    decisions = await agent_analyze_and_act_batch([
+        (
+            f"Humedad critica detectada en planta {plant_id} del jardin {garden_name}",
+            {
                 "garden_id": garden_id,
                 "garden_name": garden_name,
                 "personality": personality,
-                "alert": alert,
-                "decision": decision,
-                "timestamp": datetime.now().isoformat()
-            })
-
-        elif moisture < 45:
-            alert = {
-                "type": "low_moisture",
-                "severity": "warning",
-                "garden_id": garden_id,
-                "garden_name": garden_name,
                 "plant_id": plant_id,
                 "plant_name": plant_data.get("name", plant_id),
-                "moisture": moisture,
-                "message": f"[{garden_name}] Humedad baja en {plant_id}: {moisture}%"
+                "moisture": alert["moisture"],
+                "threshold": CRIT_MOISTURE,
+                "last_irrigation": plant_data.get("last_irrigation"),
+                "tank_level": tank_level
             }
-            if collect_results:
-                alerts.append(alert)
-
-            # Send Telegram alert for low moisture warnings
-            try:
-                from irrigation_agent.service.telegram_service import send_moisture_alert
-                send_moisture_alert(
-                    garden_name=garden_name,
-                    plant_name=plant_data.get("name", plant_id),
-                    moisture=moisture,
-                    severity="warning"
-                )
-            except Exception as telegram_err:
-                logger.warning(f"Failed to send Telegram moisture alert: {telegram_err}")
-
-            await manager.broadcast({
-                "type": "alert",
-                "garden_id": garden_id,
-                "garden_name": garden_name,
-                "personality": personality,
-                "alert": alert,
-                "timestamp": datetime.now().isoformat()
-            })
-
-    return alerts, decisions
+        )
+        for plant_id, plant_data, alert in critical
+    ], tools_available, config) if critical else []
+
+    decided_ts = now_iso()
+    await asyncio.gather(*(
+        manager.broadcast({
+            "type": "agent_decision",
+            "garden_id": garden_id,
+            "garden_name": garden_name,
+            "personality": personality,
+            "alert": alert,
+            "decision": decision,
+            "timestamp": decided_ts
+        })
+        for (_, _, alert), decision in zip(critical, decisions)
+    ))
+
+    if not collect_results:
+        return [], []
+    return alerts, list(decisions)
 
 
 async def monitor_system(tools_available: bool):
@@ -237,10 +584,37 @@ async def monitor_system(tools_available: bool):
     Triggers agent decisions based on garden context and personality.
     Runs as a background task when the application starts.
 
+    Gardens are spread over MONITOR_SHARDS concurrent loops (see monitor_shard).
+
     Args:
         tools_available: Whether irrigation tools are available
     """
-    logger.info("Starting garden monitoring task")
+    logger.info(f"Starting garden monitoring task ({MONITOR_SHARDS} shards)")
+    await asyncio.gather(*(
+        monitor_shard(tools_available, shard_id, MONITOR_SHARDS) for shard_id in range(MONITOR_SHARDS)
+    ))
+
+
+def _garden_shard(garden_id: str, num_shards: int) -> int:
+    # crc32 rather than hash(): stable across processes and restarts
+    return zlib.crc32(str(garden_id).encode()) % num_shards
+
+
+async def monitor_shard(tools_available: bool, shard_id: int = 0, num_shards: int = 1):
+    """
+    Monitoring loop for the gardens that hash to one shard.
+
+    Every shard reads the same cached all-gardens sweep, so N shards still cost
+    one upstream read per tick, but each keeps its own cadence.
+
+    Args:
+        tools_available: Whether irrigation tools are available
+        shard_id: This loop's shard, in range(num_shards)
+        num_shards: Total number of shards
+    """
+    monitoring_interval = int(os.getenv('MONITORING_INTERVAL_SECONDS', '30'))
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
 
     while True:
         try:
@@ -248,33 +622,44 @@ async def monitor_system(tools_available: bool):
                 await asyncio.sleep(60)
                 continue
 
-            # Import dependencies
-            from irrigation_agent.tools import get_all_gardens_status
-            from irrigation_agent.config import config
             from api.websocket import manager
 
-            # Get status for all gardens
-            gardens_status = get_all_gardens_status()
+            # Get status for all gardens (blocking reads, off the event loop;
+            # shared with the other shards and manual triggers for a few seconds)
+            gardens_status = await get_cached_gardens_status()
 
             if gardens_status.get("status") != "success":
-                logger.error(f"Error getting gardens status: {gardens_status.get('error')}")
+                logger.error(f"Error getting gardens status (shard {shard_id}): {gardens_status.get('error')}")
                 await asyncio.sleep(60)
+                next_tick = loop.time()
                 continue
 
-            for garden_id, garden_data in gardens_status.get("gardens", {}).items():
-                await process_garden_monitoring(
+            garden_ids = [
+                garden_id for garden_id in gardens_status.get("gardens", {})
+                if _garden_shard(garden_id, num_shards) == shard_id
+            ]
+            results = await asyncio.gather(*(
+                process_garden_monitoring(
                     garden_id,
-                    garden_data,
+                    gardens_status["gardens"][garden_id],
                     manager,
                     tools_available,
-                    config,
+                    app_config,
                     collect_results=False
                 )
-
-            # Sleep for monitoring interval
-            monitoring_interval = int(os.getenv('MONITORING_INTERVAL_SECONDS', '30'))
-            await asyncio.sleep(monitoring_interval)
+                for garden_id in garden_ids
+            ), return_exceptions=True)
+            for garden_id, result in zip(garden_ids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error monitoring garden {garden_id}: {result}")
+
+            # Sleep until the next tick, measured from when this one was due
+            # so sweep time doesn't stretch the cadence; after an overrun,
+            # start right away instead of queueing missed ticks
+            next_tick = max(next_tick + monitoring_interval, loop.time())
+            await asyncio.sleep(next_tick - loop.time())
 
         except Exception as e:
-            logger.error(f"Error in monitoring task: {e}")
+            logger.error(f"Error in monitoring task (shard {shard_id}): {e}")
             await asyncio.sleep(60)
+            next_tick = loop.time()
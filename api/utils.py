@@ -0,0 +1,34 @@
+"""Small helpers the API shares with the irrigation agent package.
+
+Importing anything under ``irrigation_agent`` runs its package init (config,
+dotenv), which may fail; the API must still start in limited mode then, so
+these fall back to stdlib equivalents instead of raising at import time.
+"""
+import json
+import logging
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    from irrigation_agent.utils.time_utils import now_iso
+    from irrigation_agent.utils.json_utils import ORJSON_AVAILABLE, dumps, loads
+    from irrigation_agent.utils.cache_utils import is_success
+except Exception as e:
+    logger.warning(f"Irrigation agent utils unavailable, using stdlib fallbacks: {e}")
+
+    ORJSON_AVAILABLE = False
+    loads = json.loads
+
+    def now_iso() -> str:
+        """Current local time as an ISO-8601 string, second precision."""
+        return datetime.now().isoformat(timespec="seconds")
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def is_success(result: Any) -> bool:
+        """``cache_if`` predicate for ``{"status": "success", ...}`` payloads."""
+        return isinstance(result, dict) and result.get("status") == "success"
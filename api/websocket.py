@@ -1,74 +1,193 @@
 """WebSocket connection manager and endpoint."""
+import asyncio
 import logging
 import json
-from datetime import datetime
-from typing import Set, Dict
+import os
+from typing import Set, Dict, List
 
 from fastapi import WebSocket, WebSocketDisconnect, HTTPException
+from pydantic import TypeAdapter, ValidationError
+
+from api.models import WebSocketChatMessage
+from api.utils import now_iso, dumps as _fast_dumps, loads as _loads
 
 logger = logging.getLogger(__name__)
 
+# A send that takes longer than this counts as failed and drops the socket
+WS_SEND_TIMEOUT_SECONDS = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "5"))
+
+# Outbound frames buffered per socket; once full, a slow client loses its
+# oldest frames rather than letting its backlog grow without bound
+WS_QUEUE_MAX = int(os.getenv("WS_QUEUE_MAX", "256"))
+
+# The chat template and GenAI helpers are resolved once, not per message
+try:
+    from irrigation_agent.utils.genai_utils import get_genai_client, generate_content_async, extract_text, extract_json_object, prompt_json
+    from prompts import WEBSOCKET_CHAT_PROMPT
+except Exception as e:
+    logger.warning(f"WebSocket chat unavailable: {e}")
+
+# Built once: validating each chat frame reuses the compiled validator
+_WS_CHAT_ADAPTER = TypeAdapter(WebSocketChatMessage)
+
+
+def encode_message(message: dict) -> str:
+    """Serialize a message once so it can be sent to any number of sockets."""
+    try:
+        return _fast_dumps(message)
+    except TypeError:
+        # orjson rejects a few inputs the stdlib accepts (e.g. non-str keys)
+        pass
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for real-time communication."""
+    """Manages WebSocket connections for real-time communication.
+
+    Each socket gets a bounded outbound queue drained by its own writer task.
+    Sending only enqueues, so a broadcast never waits on any client and each
+    socket sees its frames in order from a single writer. A socket whose send
+    fails is dropped and closed with 1011 so the client reconnects.
+    """
 
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
         self.device_connections: Dict[str, Set[WebSocket]] = {}
         self.websocket_devices: Dict[WebSocket, str] = {}
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        self._closing: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket, device_id: str):
         await websocket.accept()
+        queue = asyncio.Queue(maxsize=WS_QUEUE_MAX)
+        self._queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
         self.active_connections.add(websocket)
         self.device_connections.setdefault(device_id, set()).add(websocket)
         self.websocket_devices[websocket] = device_id
-        logger.info(f"New WebSocket connection. Total: {len(self.active_connections)}")
+        # Connection churn is per-client traffic; keep it out of the INFO log
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"New WebSocket connection. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
+        self._forget(websocket)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"WebSocket disconnected. Total: {len(self.active_connections)}")
+
+    def disconnect_many(self, websockets: List[WebSocket]):
+        """Drop several sockets at once and close them with 1011.
+
+        Sockets already dropped (e.g. by a concurrent broadcast that saw the
+        same failure) are ignored.
+        """
+        gone = self.active_connections.intersection(websockets)
+        if not gone:
+            return
+        self.active_connections -= gone
+        for websocket in gone:
+            self._release(websocket)
+            # Close it too, or the client keeps talking to a socket nobody writes to
+            task = asyncio.create_task(self._close(websocket))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        # Failure sites already log at ERROR; the running total is churn detail
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{len(gone)} WebSocket(s) disconnected. Total: {len(self.active_connections)}")
+
+    def _forget(self, websocket: WebSocket):
         self.active_connections.discard(websocket)
+        self._release(websocket)
+
+    def _release(self, websocket: WebSocket):
+        """Drop a socket's device mapping, queue and writer task."""
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         did = self.websocket_devices.pop(websocket, None)
-        if did and did in self.device_connections:
+        if did is not None:
             conns = self.device_connections.get(did)
             if conns is not None:
                 conns.discard(websocket)
                 if not conns:
                     self.device_connections.pop(did, None)
-        logger.info(f"WebSocket disconnected. Total: {len(self.active_connections)}")
+
+    async def _close(self, websocket: WebSocket):
+        try:
+            await asyncio.wait_for(websocket.close(code=1011), WS_SEND_TIMEOUT_SECONDS)
+        except Exception:
+            # Already closed by the client, or the transport is gone
+            pass
+
+    @staticmethod
+    async def _send(websocket: WebSocket, payload: str):
+        """``send_text`` bounded by WS_SEND_TIMEOUT_SECONDS.
+
+        Not wait_for: before 3.12 it swallows a cancellation that lands as the
+        send completes, leaving the writer blocked on its queue forever.
+        """
+        send = asyncio.ensure_future(websocket.send_text(payload))
+        try:
+            done, _ = await asyncio.wait((send,), timeout=WS_SEND_TIMEOUT_SECONDS)
+        except asyncio.CancelledError:
+            send.cancel()
+            raise
+        if not done:
+            send.cancel()
+            raise asyncio.TimeoutError()
+        send.result()
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        try:
+            while True:
+                payload = await queue.get()
+                await self._send(websocket, payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending to WebSocket: {e!r}")
+            self.disconnect_many([websocket])
+
+    def _enqueue(self, websockets, payload: str) -> List[WebSocket]:
+        """Queue ``payload`` for each socket; return the ones no longer managed.
+
+        A full queue drops its oldest frame to make room, so a slow client
+        falls behind on stale updates instead of being disconnected.
+        """
+        gone = []
+        lagging = 0
+        for websocket in websockets:
+            queue = self._queues.get(websocket)
+            if queue is None:
+                gone.append(websocket)
+                continue
+            if queue.full():
+                queue.get_nowait()
+                lagging += 1
+            queue.put_nowait(payload)
+        if lagging:
+            logger.warning(f"Send queue full for {lagging} WebSocket(s), dropped their oldest frame")
+        return gone
 
     async def broadcast(self, message: dict):
         """Send message to all connected clients."""
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending to WebSocket: {e}")
-                disconnected.add(connection)
-
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        if not self.active_connections:
+            return
+        self._enqueue(tuple(self.active_connections), encode_message(message))
 
     async def send_personal(self, message: dict, websocket: WebSocket):
         """Send message to specific client."""
-        try:
-            await websocket.send_json(message)
-        except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
-            self.disconnect(websocket)
+        if self._enqueue((websocket,), encode_message(message)):
+            # Dropped after a failed send and already being closed
+            logger.error("Error sending personal message: socket no longer connected")
 
     async def send_to_device(self, device_id: str, message: dict):
         """Send a message to all sockets associated with a device_id."""
-        conns = self.device_connections.get(device_id, set())
-        disconnected = set()
-        for ws in list(conns):
-            try:
-                await ws.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending to device {device_id}: {e}")
-                disconnected.add(ws)
-        for ws in disconnected:
-            self.disconnect(ws)
+        conns = tuple(self.device_connections.get(device_id, ()))
+        if not conns:
+            return
+        self._enqueue(conns, encode_message(message))
 
 
 # Global connection manager instance
@@ -100,12 +219,12 @@ async def websocket_endpoint(websocket: WebSocket, device_id: str, tools_availab
             "type": "connection",
             "message": "Conectado a GrowthAI - Sistema de Irrigacion Inteligente",
             "device_id": device_id,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }, websocket)
 
         # Listen for incoming messages from client
         while True:
-            data = await websocket.receive_json()
+            data = _loads(await websocket.receive_text())
 
             message_type = data.get("type")
 
@@ -117,7 +236,7 @@ async def websocket_endpoint(websocket: WebSocket, device_id: str, tools_availab
                     "device_id": device_id,
                     "garden_id": data.get("garden_id"),
                     "data": data.get("data", data),
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso(),
                 }
                 await manager.broadcast(payload)
                 continue
@@ -126,20 +245,29 @@ async def websocket_endpoint(websocket: WebSocket, device_id: str, tools_availab
                 await manager.send_personal({
                     "type": "pong",
                     "device_id": device_id,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso()
                 }, websocket)
                 continue
 
             if message_type == "chat":
                 # Garden-scoped chat: require garden_id and include plants info as context
-                user_message = data.get("message", "")
-                garden_id = data.get("garden_id")
+                try:
+                    chat = _WS_CHAT_ADAPTER.validate_python(data)
+                except ValidationError as e:
+                    await manager.send_personal({
+                        "type": "error",
+                        "message": f"Mensaje de chat invalido: {e.error_count()} campo(s) con formato incorrecto",
+                        "timestamp": now_iso()
+                    }, websocket)
+                    continue
+                user_message = chat.message
+                garden_id = chat.garden_id
 
                 if not tools_available:
                     await manager.send_personal({
                         "type": "chat_response",
                         "response": "Lo siento, el agente no esta disponible en este momento.",
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": now_iso()
                     }, websocket)
                     continue
 
@@ -147,22 +275,20 @@ async def websocket_endpoint(websocket: WebSocket, device_id: str, tools_availab
                     await manager.send_personal({
                         "type": "error",
                         "message": "El chat es por jardin. Incluye 'garden_id' en el mensaje.",
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": now_iso()
                     }, websocket)
                     continue
 
                 try:
-                    from irrigation_agent.utils.genai_utils import get_genai_client, extract_text, extract_json_object
                     from irrigation_agent.tools import get_garden_status
-                    from prompts import WEBSOCKET_CHAT_PROMPT
 
                     client = get_genai_client()
-                    garden_data = get_garden_status(garden_id)
+                    garden_data = await asyncio.to_thread(get_garden_status, garden_id)
                     if garden_data.get("status") != "success":
                         await manager.send_personal({
                             "type": "error",
                             "message": f"Jardin '{garden_id}' no encontrado o sin datos",
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": now_iso()
                         }, websocket)
                         continue
 
@@ -172,11 +298,12 @@ async def websocket_endpoint(websocket: WebSocket, device_id: str, tools_availab
                     context_prompt = WEBSOCKET_CHAT_PROMPT.format(
                         garden_name=garden_name,
                         personality=personality,
-                        garden_data=garden_data,
+                        garden_data=prompt_json(garden_data),
                         user_message=user_message
                     )
 
-                    response = client.models.generate_content(
+                    response = await generate_content_async(
+                        client,
                         model=config.worker_model,
                         contents=context_prompt
                     )
@@ -200,7 +327,7 @@ async def websocket_endpoint(websocket: WebSocket, device_id: str, tools_availab
                             "data": response_data.get("data", {}),
                             "suggestions": response_data.get("suggestions", []),
                             "priority": response_data.get("priority", "info"),
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": now_iso()
                         }, websocket)
 
                     except (json.JSONDecodeError, AttributeError):
@@ -216,7 +343,7 @@ async def websocket_endpoint(websocket: WebSocket, device_id: str, tools_availab
                             "data": {},
                             "suggestions": [],
                             "priority": "info",
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": now_iso()
                         }, websocket)
 
                 except Exception as e:
@@ -224,32 +351,32 @@ async def websocket_endpoint(websocket: WebSocket, device_id: str, tools_availab
                     await manager.send_personal({
                         "type": "error",
                         "message": f"Error al procesar mensaje: {str(e)}",
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": now_iso()
                     }, websocket)
 
             elif message_type == "request_status":
                 # Client requesting current system status
                 try:
-                    from irrigation_agent.tools import get_system_status
-                    status = get_system_status()
+                    from api.services.cache import get_cached_status
+                    status = await get_cached_status()
                     await manager.send_personal({
                         "type": "system_status",
                         "data": status,
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": now_iso()
                     }, websocket)
                 except Exception as e:
                     logger.error(f"Error getting status: {e}")
                     await manager.send_personal({
                         "type": "error",
                         "message": str(e),
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": now_iso()
                     }, websocket)
 
             elif message_type == "ping":
                 # Keep-alive ping
                 await manager.send_personal({
                     "type": "pong",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso()
                 }, websocket)
 
     except WebSocketDisconnect:
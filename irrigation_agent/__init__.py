@@ -5,13 +5,22 @@ Coordinates specialized agents for sensor monitoring, plant health analysis,
 alert management, and irrigation optimization.
 """
 
-from .agent import (
-    intelligent_irrigation_agent,
-    irrigation_orchestrator,
-    root_agent
-)
+from importlib import import_module
+
 from .config import config, iot_config, weather_config, notification_config
 
+# The agent graph pulls in google.adk, which the API server never uses; load
+# it on first attribute access instead of at package import.
+_AGENT_EXPORTS = frozenset({"intelligent_irrigation_agent", "irrigation_orchestrator", "root_agent"})
+
+
+def __getattr__(name):
+    if name == "agent":
+        return import_module(".agent", __name__)
+    if name in _AGENT_EXPORTS:
+        return getattr(import_module(".agent", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "intelligent_irrigation_agent",
     "irrigation_orchestrator",
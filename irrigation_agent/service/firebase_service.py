@@ -7,7 +7,7 @@ as a replacement for the physical Raspberry Pi sensors during development.
 import os
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -97,6 +97,26 @@ class FirestoreSimulator:
             plant_data = data.get('plants', {}).get(plant_name)
             return plant_data.get('current_moisture') if plant_data else None
 
+    def get_plants_moisture(self, plant_names: List[str]) -> Dict[str, Optional[int]]:
+        """Get current moisture for several plants in a single round trip."""
+        if self.use_firestore and self.db:
+            try:
+                refs = [self.db.collection('plants').document(name) for name in plant_names]
+                result: Dict[str, Optional[int]] = dict.fromkeys(plant_names)
+                for doc in self.db.get_all(refs, field_paths=['current_moisture']):
+                    if doc.exists:
+                        result[doc.id] = doc.to_dict().get('current_moisture')
+                return result
+            except Exception as e:
+                logger.error(f"Error reading from Firestore: {e}")
+                return dict.fromkeys(plant_names)
+        else:
+            plants = self._load_local_data().get('plants', {})
+            return {
+                name: (plants.get(name) or {}).get('current_moisture')
+                for name in plant_names
+            }
+
     def get_plant_history(self, plant_name: str, hours: int = 24) -> list:
         """Get historical moisture data for a plant."""
         if self.use_firestore and self.db:
@@ -117,6 +137,27 @@ class FirestoreSimulator:
                 return plant_data['history'][:hours]
             return []
 
+    def get_moisture_series(self, plant_name: str, hours: int = 24) -> list:
+        """Get only the moisture values of a plant's recent history.
+
+        Fetches just the ``history`` field from Firestore rather than the whole
+        plant document, and flattens it to a list of numbers.
+        """
+        if self.use_firestore and self.db:
+            try:
+                doc_ref = self.db.collection('plants').document(plant_name)
+                doc = doc_ref.get(field_paths=['history'])
+                history = doc.to_dict().get('history', []) if doc.exists else []
+            except Exception as e:
+                logger.error(f"Error reading history from Firestore: {e}")
+                return []
+        else:
+            data = self._load_local_data()
+            history = (data.get('plants', {}).get(plant_name) or {}).get('history', [])
+        if not isinstance(history, list):
+            return []
+        return [reading.get('moisture', 0) for reading in history[:hours]]
+
     def get_water_tank_status(self) -> Dict[str, Any]:
         """Get water tank status."""
         if self.use_firestore and self.db:
@@ -223,6 +264,30 @@ class FirestoreSimulator:
                 return {}
         return {}
 
+    def get_all_garden_plants(self) -> Dict[str, Dict[str, Any]]:
+        """Get plants for every garden in one query, grouped by garden ID.
+
+        A failed read raises instead of returning ``{}``, which would look
+        like every garden being empty and healthy.
+        """
+        if self.use_firestore and self.db:
+            try:
+                docs = self.db.collection_group('plants').stream()
+                grouped: Dict[str, Dict[str, Any]] = {}
+                for doc in docs:
+                    garden_ref = doc.reference.parent.parent
+                    # Skip the legacy top-level 'plants' collection
+                    if garden_ref is None or garden_ref.parent.id != 'gardens':
+                        continue
+                    plant_data = self._convert_timestamps(doc.to_dict())
+                    plant_data['id'] = doc.id
+                    grouped.setdefault(garden_ref.id, {})[doc.id] = plant_data
+                return grouped
+            except Exception as e:
+                logger.error(f"Error reading plants for all gardens: {e}")
+                raise
+        return {}
+
     def get_garden_plant(self, garden_id: str, plant_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific plant from a garden."""
         if self.use_firestore and self.db:
@@ -11,39 +11,55 @@ def _b64(data: bytes) -> str:
     return base64.b64encode(data).decode('utf-8')
 
 
+_IMAGE_PROMPT = (
+    "Eres un agrónomo. Analiza la imagen de una planta y responde en JSON con: "
+    "{\"disease\": string|\"none\", \"causes\": [..], \"cures\": [..], \"severity\": \"low|medium|high\", "
+    "\"confidence\": 0-1, \"summary\": string}. Si no puedes determinar, usa disease=none y confidence baja."
+)
+
+
+def _image_request(image_bytes: bytes, content_type: str) -> Dict[str, Any]:
+    """generate_content kwargs for an image analysis."""
+    # Inline image via base64 if supported by client
+    contents = [
+        {"role": "user", "parts": [
+            {"text": _IMAGE_PROMPT},
+            {"inline_data": {"mime_type": content_type, "data": _b64(image_bytes)}},
+        ]}
+    ]
+    return {"model": os.getenv("AI_MODEL", "gemini-2.5-pro"), "contents": contents}
+
+
+def _analysis_result(response: Any) -> Dict[str, Any]:
+    from irrigation_agent.utils.genai_utils import extract_text, extract_json_object
+    text = extract_text(response)
+    data, raw = extract_json_object(text)
+    if not data:
+        data = {"summary": text.strip()}
+    return {"status": "success", "analysis": data, "timestamp": datetime.now().isoformat()}
+
+
 def analyze_plant_image(image_bytes: bytes, content_type: str = "image/jpeg") -> Dict[str, Any]:
     """Analyze a plant image using the configured GenAI client.
 
     Returns a dict with fields: status, analysis { disease, causes, cures, severity, confidence, summary }.
     """
     try:
-        from irrigation_agent.utils.genai_utils import get_genai_client, extract_text, extract_json_object
+        from irrigation_agent.utils.genai_utils import get_genai_client
         client = get_genai_client()
+        response = client.models.generate_content(**_image_request(image_bytes, content_type))
+        return _analysis_result(response)
+    except Exception as e:
+        logger.error(f"Image analysis failed: {e}")
+        return {"status": "error", "error": str(e), "timestamp": datetime.now().isoformat()}
 
-        prompt = (
-            "Eres un agrónomo. Analiza la imagen de una planta y responde en JSON con: "
-            "{\"disease\": string|\"none\", \"causes\": [..], \"cures\": [..], \"severity\": \"low|medium|high\", "
-            "\"confidence\": 0-1, \"summary\": string}. Si no puedes determinar, usa disease=none y confidence baja."
-        )
-
-        # Inline image via base64 if supported by client
-        b64 = _b64(image_bytes)
-        contents = [
-            {"role": "user", "parts": [
-                {"text": prompt},
-                {"inline_data": {"mime_type": content_type, "data": b64}},
-            ]}
-        ]
-
-        response = client.models.generate_content(
-            model=os.getenv("AI_MODEL", "gemini-2.5-pro"),
-            contents=contents,
-        )
-        text = extract_text(response)
-        data, raw = extract_json_object(text)
-        if not data:
-            data = {"summary": text.strip()}
-        return {"status": "success", "analysis": data, "timestamp": datetime.now().isoformat()}
+
+async def analyze_plant_image_async(image_bytes: bytes, content_type: str = "image/jpeg") -> Dict[str, Any]:
+    """``analyze_plant_image`` on the client's async API, for event-loop callers."""
+    try:
+        from irrigation_agent.utils.genai_utils import get_genai_client, generate_content_async
+        response = await generate_content_async(get_genai_client(), **_image_request(image_bytes, content_type))
+        return _analysis_result(response)
     except Exception as e:
         logger.error(f"Image analysis failed: {e}")
         return {"status": "error", "error": str(e), "timestamp": datetime.now().isoformat()}
@@ -14,6 +14,30 @@ import requests
 from ..config import notification_config
 
 
+# Lookup tables are built once at import rather than on every message.
+_DECISION_EMOJI = {
+    "regar": "💧",
+    "esperar": "⏳",
+    "alerta": "⚠️",
+    "ajustar": "🛠️",
+}
+
+_PRIORITY_ICON = {
+    "critical": "🔴",
+    "high": "🟠",
+    "medium": "🟡",
+    "low": "🟢",
+}
+
+_PERSONALITY_EMOJI = {
+    "friendly": "🙂",
+    "professional": "🧑‍💼",
+    "playful": "😜",
+    "caring": "🤝",
+    "neutral": "🤖",
+}
+
+
 def send_agent_decision_notification(
     garden_name: str,
     plant_name: str,
@@ -27,21 +51,8 @@ def send_agent_decision_notification(
     if not notification_config.has_telegram:
         return {"status": "skipped", "reason": "Telegram not configured"}
 
-    emoji_map = {
-        "regar": "💧",
-        "esperar": "⏳",
-        "alerta": "⚠️",
-        "ajustar": "🛠️",
-    }
-    priority_emoji = {
-        "critical": "🔴",
-        "high": "🟠",
-        "medium": "🟡",
-        "low": "🟢",
-    }
-
-    decision_emoji = emoji_map.get(decision, "🌱")
-    priority_icon = priority_emoji.get(priority, "🟡")
+    decision_emoji = _DECISION_EMOJI.get(decision, "🌱")
+    priority_icon = _PRIORITY_ICON.get(priority, "🟡")
 
     personality_emoji = _get_personality_emoji(personality)
     bar_html = _create_moisture_bar(moisture)
@@ -163,14 +174,7 @@ def _get_personality_emoji(personality: Optional[str]) -> str:
     """Map personality to an emoji indicator."""
     if not personality:
         return ""
-    mapping = {
-        "friendly": "🙂",
-        "professional": "🧑‍💼",
-        "playful": "😜",
-        "caring": "🤝",
-        "neutral": "🤖",
-    }
-    return mapping.get(personality.lower(), "🌱")
+    return _PERSONALITY_EMOJI.get(personality.lower(), "🌱")
 
 
 def _escape_html(text: str) -> str:
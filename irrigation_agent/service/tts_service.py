@@ -3,6 +3,8 @@ from elevenlabs.client import ElevenLabs
 import os
 import base64
 
+from irrigation_agent.utils.cache_utils import ttl_cache
+
 load_dotenv()
 
 _api_key = os.getenv("ELEVENLABS_API_KEY")
@@ -11,13 +13,32 @@ _client = ElevenLabs(
 ) if _api_key else None
 
 
+# Alerts repeat the same short phrases ("tanque bajo", ...); identical
+# requests reuse the earlier audio instead of paying for another ElevenLabs
+# call. Only clips up to TTS_CACHE_MAX_B64_CHARS are kept (roughly 6 s of
+# speech), so one-off chat replies don't fill memory: the cache holds at most
+# TTS_CACHE_MAX_ENTRIES * TTS_CACHE_MAX_B64_CHARS (~8 MB). Failures (None)
+# are never cached.
+TTS_CACHE_TTL_SECONDS = 24 * 3600
+TTS_CACHE_MAX_ENTRIES = 64
+TTS_CACHE_MAX_B64_CHARS = 128 * 1024
+
+
+def _cacheable_audio(audio_base64: str | None) -> bool:
+    return audio_base64 is not None and len(audio_base64) <= TTS_CACHE_MAX_B64_CHARS
+
+
+@ttl_cache(TTS_CACHE_TTL_SECONDS, cache_if=_cacheable_audio, maxsize=TTS_CACHE_MAX_ENTRIES)
 def convert_text_to_speech(
     text: str,
     voice_id: str = "JBFqnCBsd6RMkjVDRZzb",
     model_id: str = "eleven_multilingual_v2",
     output_format: str = "mp3_44100_128",
 ) -> str | None:
-    """Convert text to speech using ElevenLabs API and return as base64 string."""
+    """Convert text to speech using ElevenLabs API and return as base64 string.
+
+    Short successful clips are memoized per (text, voice, model, format).
+    """
     if not text:
         return None
     if not _client or not _api_key:
@@ -31,15 +52,15 @@ def convert_text_to_speech(
         output_format=output_format,
     )
 
-    # Collect all audio chunks into bytes
-    audio_chunks = b""
+    # Accumulate in place; bytes += bytes recopies the whole buffer per chunk
+    audio_chunks = bytearray()
     for chunk in audio_generator:
         if isinstance(chunk, bytes):
-            audio_chunks += chunk
+            audio_chunks.extend(chunk)
 
     if not audio_chunks:
         return None
 
-    audio_base64 = base64.b64encode(audio_chunks).decode("utf-8")
+    audio_base64 = base64.b64encode(audio_chunks).decode("ascii")
     return audio_base64
 
@@ -5,300 +5,72 @@ This module provides functions to fetch weather data using Google's Weather API.
 
 import os
 import logging
+from bisect import bisect_right
 import requests
-from typing import Dict, Any, Optional
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Tuple
+
+from irrigation_agent.utils.cache_utils import ttl_cache, is_success
+from irrigation_agent.utils.json_utils import loads as json_loads
+from irrigation_agent.utils.time_utils import now_iso
 
 logger = logging.getLogger(__name__)
 
 WEATHER_API_ENDPOINT = "https://weather.googleapis.com/v1/locations:forecast"
 
+# Forecasts change on a timescale of minutes; nearby gardens (~100 m buckets)
+# share one upstream request within this window.
+WEATHER_CACHE_TTL_SECONDS = 600
 
-def get_weather_for_garden(latitude: float, longitude: float) -> Dict[str, Any]:
-    """
-    Get current weather and forecast for a garden location using Google Weather API.
-
-    Args:
-        latitude: Latitude coordinate of the garden
-        longitude: Longitude coordinate of the garden
-
-    Returns:
-        Dictionary with weather data:
-        {
-            "current": {...},
-            "forecast": [...],
-            "status": "success|error",
-            "timestamp": "..."
-        }
-    """
-    try:
-        # Get API key from environment or use Application Default Credentials
-        api_key = os.getenv("GOOGLE_WEATHER_API_KEY")
-
-        # Build request
-        params = {
-            "latLng": {
-                "latitude": latitude,
-                "longitude": longitude
-            },
-            "languageCode": "es",  # Spanish
-            "units": "metric"
-        }
-
-        headers = {}
-        if api_key:
-            headers["X-Goog-Api-Key"] = api_key
-
-        # Make request to Weather API
-        response = requests.post(
-            WEATHER_API_ENDPOINT,
-            json=params,
-            headers=headers,
-            timeout=10
-        )
-
-        if response.status_code == 200:
-            weather_data = response.json()
-
-            # Extract relevant information
-            current_conditions = extract_current_conditions(weather_data)
-            forecast = extract_forecast(weather_data)
-
-            return {
-                "current": current_conditions,
-                "forecast": forecast,
-                "location": {
-                    "latitude": latitude,
-                    "longitude": longitude
-                },
-                "status": "success",
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            logger.error(f"Weather API error: {response.status_code} - {response.text}")
-            return {
-                "status": "error",
-                "error": f"API returned status {response.status_code}",
-                "timestamp": datetime.now().isoformat()
-            }
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error fetching weather data: {e}")
-        return {
-            "status": "error",
-            "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in weather service: {e}")
-        return {
-            "status": "error",
-            "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
-
+# Keep-alive pool for the Weather API host so concurrent garden lookups reuse
+# TLS connections instead of opening a new one per request.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
 
-def extract_current_conditions(weather_data: Dict) -> Dict[str, Any]:
-    """Extract current weather conditions from API response."""
-    try:
-        # Google Weather API structure may vary, adapt as needed
-        current = weather_data.get("currentConditions", {})
+# should_skip_irrigation results keyed by id() of the forecast list. Cached
+# weather dicts (and their shallow copies) share that list, so repeated
+# evaluations of one forecast are dict hits. Each entry holds the list itself,
+# which keeps the id from being reused while the entry lives.
+_SKIP_MEMO_MAX = 128
+_skip_memo: Dict[int, Tuple[list, Dict[str, Any]]] = {}
 
-        return {
-            "temperature": current.get("temperature", {}).get("value"),
-            "humidity": current.get("humidity", {}).get("value"),
-            "precipitation": current.get("precipitation", {}).get("value"),
-            "wind_speed": current.get("windSpeed", {}).get("value"),
-            "condition": current.get("weatherCondition", {}).get("description"),
-            "uv_index": current.get("uvIndex", {}).get("value")
-        }
-    except Exception as e:
-        logger.warning(f"Error extracting current conditions: {e}")
-        return {}
 
+# Shared default for nested lookups; never mutated.
+_EMPTY: Dict[str, Any] = {}
 
-def extract_forecast(weather_data: Dict) -> list:
-    """Extract weather forecast from API response."""
-    try:
-        forecasts = weather_data.get("dailyForecasts", [])
-
-        forecast_list = []
-        for day in forecasts[:7]:  # Next 7 days
-            forecast_list.append({
-                "date": day.get("date"),
-                "temp_max": day.get("temperatureMax", {}).get("value"),
-                "temp_min": day.get("temperatureMin", {}).get("value"),
-                "precipitation_probability": day.get("precipitationProbability", {}).get("value"),
-                "precipitation_amount": day.get("precipitationAmount", {}).get("value"),
-                "condition": day.get("weatherCondition", {}).get("description")
-            })
-
-        return forecast_list
-    except Exception as e:
-        logger.warning(f"Error extracting forecast: {e}")
-        return []
-
-
-def should_skip_irrigation(weather_forecast: Dict) -> Dict[str, Any]:
-    """
-    Analyze weather forecast to determine if irrigation should be skipped.
-
-    Args:
-        weather_forecast: Weather data from get_weather_for_garden()
-
-    Returns:
-        Dictionary with recommendation:
-        {
-            "skip_irrigation": bool,
-            "reason": str,
-            "rain_expected": bool,
-            "rain_probability": float,
-            "rain_amount_mm": float
-        }
-    """
-    try:
-        if weather_forecast.get("status") != "success":
-            return {
-                "skip_irrigation": False,
-                "reason": "No weather data available",
-                "rain_expected": False
-            }
-
-        forecast = weather_forecast.get("forecast", [])
-        if not forecast:
-            return {
-                "skip_irrigation": False,
-                "reason": "No forecast data",
-                "rain_expected": False
-            }
-
-        # Check next 24-48 hours
-        upcoming_weather = forecast[:2]  # Next 2 days
+# (output key, currentConditions field, leaf key) for extract_current_conditions.
+_CURRENT_FIELDS = (
+    ("temperature", "temperature", "value"),
+    ("humidity", "humidity", "value"),
+    ("precipitation", "precipitation", "value"),
+    ("wind_speed", "windSpeed", "value"),
+    ("condition", "weatherCondition", "description"),
+    ("uv_index", "uvIndex", "value"),
+)
 
-        total_rain = 0
-        max_probability = 0
 
-        for day in upcoming_weather:
-            prob = day.get("precipitation_probability", 0)
-            amount = day.get("precipitation_amount", 0)
+# Soil moisture cut points for recommendations: below 30% is critical,
+# below 45% moderate, otherwise low urgency.
+_MOISTURE_BINS = (30, 45)
+_MOISTURE_URGENCY = (
+    ("critical", "irrigate_now"),
+    ("moderate", "irrigate_soon"),
+    ("low", "monitor"),
+)
 
-            if prob:
-                max_probability = max(max_probability, prob)
-            if amount:
-                total_rain += amount
 
-        # Decision logic
-        skip = False
-        reason = ""
-
-        if max_probability >= 70 and total_rain >= 5:
-            skip = True
-            reason = f"Lluvia muy probable ({max_probability}%) con {total_rain:.1f}mm esperados en 48h"
-        elif max_probability >= 50 and total_rain >= 10:
-            skip = True
-            reason = f"Lluvia probable ({max_probability}%) con {total_rain:.1f}mm esperados en 48h"
-        elif total_rain >= 15:
-            skip = True
-            reason = f"Se esperan {total_rain:.1f}mm de lluvia en las prÃ³ximas 48h"
-
-        return {
-            "skip_irrigation": skip,
-            "reason": reason if skip else "No se espera lluvia significativa",
-            "rain_expected": max_probability >= 40,
-            "rain_probability": max_probability,
-            "rain_amount_mm": total_rain
-        }
-
-    except Exception as e:
-        logger.error(f"Error analyzing weather for irrigation: {e}")
-        return {
-            "skip_irrigation": False,
-            "reason": f"Error analyzing weather: {str(e)}",
-            "rain_expected": False
-        }
-
-
-def get_irrigation_recommendation(weather_data: Dict, current_moisture: float) -> Dict[str, Any]:
-    """
-    Get irrigation recommendation based on weather and current soil moisture.
-
-    Args:
-        weather_data: Weather forecast data
-        current_moisture: Current soil moisture percentage
-
-    Returns:
-        Recommendation dictionary with action and reasoning
-    """
-    try:
-        current = weather_data.get("current", {})
-        temperature = current.get("temperature")
-        humidity = current.get("humidity")
-
-        # Check if we should skip due to rain
-        rain_check = should_skip_irrigation(weather_data)
-
-        # Base recommendation on moisture
-        if current_moisture < 30:
-            urgency = "critical"
-            base_action = "irrigate_now"
-        elif current_moisture < 45:
-            urgency = "moderate"
-            base_action = "irrigate_soon"
-        else:
-            urgency = "low"
-            base_action = "monitor"
-
-        # Adjust based on weather
-        if rain_check["skip_irrigation"] and urgency != "critical":
-            final_action = "skip"
-            reason = f"Humedad actual: {current_moisture}%. {rain_check['reason']}"
-        elif temperature and temperature > 30 and current_moisture < 50:
-            final_action = "irrigate_soon"
-            reason = f"Temperatura alta ({temperature}Â°C) aumenta evaporaciÃ³n. Humedad: {current_moisture}%"
-        else:
-            final_action = base_action
-            reason = f"Humedad actual: {current_moisture}%. Temp: {temperature}Â°C, Humedad ambiental: {humidity}%"
-
-        return {
-            "action": final_action,
-            "reason": reason,
-            "urgency": urgency,
-            "weather_considered": True,
-            "rain_forecast": rain_check,
-            "timestamp": datetime.now().isoformat()
-        }
-
-    except Exception as e:
-        logger.error(f"Error generating irrigation recommendation: {e}")
-        return {
-            "action": "monitor",
-            "reason": f"Error analyzing weather: {str(e)}",
-            "urgency": "unknown",
-            "weather_considered": False,
-            "timestamp": datetime.now().isoformat()
-        }
-
-
-"""Google Weather API integration service.
-
-This module provides functions to fetch weather data using Google's Weather API.
-"""
-
-import os
-import logging
-import requests
-from typing import Dict, Any
-from datetime import datetime
-
-logger = logging.getLogger(__name__)
-
-WEATHER_API_ENDPOINT = "https://weather.googleapis.com/v1/locations:forecast"
+def _location_key(latitude: float, longitude: float) -> tuple:
+    return round(latitude, 3), round(longitude, 3)
 
 
+@ttl_cache(WEATHER_CACHE_TTL_SECONDS, key=_location_key, cache_if=is_success, maxsize=512)
 def get_weather_for_garden(latitude: float, longitude: float) -> Dict[str, Any]:
     """
     Get current weather and forecast for a garden location using Google Weather API.
 
+    Successful responses are cached per ~100 m cell for
+    ``WEATHER_CACHE_TTL_SECONDS``; callers must not mutate the returned dict.
+
     Args:
         latitude: Latitude coordinate of the garden
         longitude: Longitude coordinate of the garden
@@ -328,7 +100,7 @@ def get_weather_for_garden(latitude: float, longitude: float) -> Dict[str, Any]:
         if api_key:
             headers["X-Goog-Api-Key"] = api_key
 
-        response = requests.post(
+        response = _session.post(
             WEATHER_API_ENDPOINT,
             json=params,
             headers=headers,
@@ -336,7 +108,7 @@ def get_weather_for_garden(latitude: float, longitude: float) -> Dict[str, Any]:
         )
 
         if response.status_code == 200:
-            weather_data = response.json()
+            weather_data = json_loads(response.content)
             current_conditions = extract_current_conditions(weather_data)
             forecast = extract_forecast(weather_data)
 
@@ -345,7 +117,7 @@ def get_weather_for_garden(latitude: float, longitude: float) -> Dict[str, Any]:
                 "forecast": forecast,
                 "location": {"latitude": latitude, "longitude": longitude},
                 "status": "success",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
         else:
             logger.error(
@@ -354,7 +126,7 @@ def get_weather_for_garden(latitude: float, longitude: float) -> Dict[str, Any]:
             return {
                 "status": "error",
                 "error": f"API returned status {response.status_code}",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
 
     except requests.exceptions.RequestException as e:
@@ -362,177 +134,152 @@ def get_weather_for_garden(latitude: float, longitude: float) -> Dict[str, Any]:
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
     except Exception as e:
         logger.error(f"Unexpected error in weather service: {e}")
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
 
 
 def extract_current_conditions(weather_data: Dict) -> Dict[str, Any]:
     """Extract current weather conditions from API response."""
-    try:
-        current = weather_data.get("currentConditions", {})
-        return {
-            "temperature": current.get("temperature", {}).get("value"),
-            "humidity": current.get("humidity", {}).get("value"),
-            "precipitation": current.get("precipitation", {}).get("value"),
-            "wind_speed": current.get("windSpeed", {}).get("value"),
-            "condition": current.get("weatherCondition", {}).get("description"),
-            "uv_index": current.get("uvIndex", {}).get("value"),
-        }
-    except Exception as e:
-        logger.warning(f"Error extracting current conditions: {e}")
-        return {}
+    current = weather_data.get("currentConditions") or _EMPTY
+    return {
+        out: (current.get(field) or _EMPTY).get(leaf)
+        for out, field, leaf in _CURRENT_FIELDS
+    }
 
 
 def extract_forecast(weather_data: Dict) -> list:
     """Extract weather forecast from API response."""
-    try:
-        forecasts = weather_data.get("dailyForecasts", [])
-        forecast_list = []
-        for day in forecasts[:7]:
-            forecast_list.append(
-                {
-                    "date": day.get("date"),
-                    "temp_max": day.get("temperatureMax", {}).get("value"),
-                    "temp_min": day.get("temperatureMin", {}).get("value"),
-                    "precipitation_probability": day.get(
-                        "precipitationProbability", {}
-                    ).get("value"),
-                    "precipitation_amount": day.get("precipitationAmount", {}).get(
-                        "value"
-                    ),
-                    "condition": day.get("weatherCondition", {}).get("description"),
-                }
-            )
-        return forecast_list
-    except Exception as e:
-        logger.warning(f"Error extracting forecast: {e}")
-        return []
+    forecasts = weather_data.get("dailyForecasts") or []
+    forecast_list = [
+        {
+            "date": day.get("date"),
+            "temp_max": (day.get("temperatureMax") or _EMPTY).get("value"),
+            "temp_min": (day.get("temperatureMin") or _EMPTY).get("value"),
+            "precipitation_probability": (day.get("precipitationProbability") or _EMPTY).get("value"),
+            "precipitation_amount": (day.get("precipitationAmount") or _EMPTY).get("value"),
+            "condition": (day.get("weatherCondition") or _EMPTY).get("description"),
+        }
+        for day in forecasts[:7]
+    ]
+    return forecast_list
 
 
 def should_skip_irrigation(weather_forecast: Dict) -> Dict[str, Any]:
     """
     Analyze weather forecast to determine if irrigation should be skipped.
     """
-    try:
-        if weather_forecast.get("status") != "success":
-            return {
-                "skip_irrigation": False,
-                "reason": "No weather data available",
-                "rain_expected": False,
-            }
-
-        forecast = weather_forecast.get("forecast", [])
-        if not forecast:
-            return {
-                "skip_irrigation": False,
-                "reason": "No forecast data",
-                "rain_expected": False,
-            }
-
-        upcoming_weather = forecast[:2]
-
-        total_rain = 0
-        max_probability = 0
-        for day in upcoming_weather:
-            prob = day.get("precipitation_probability", 0)
-            amount = day.get("precipitation_amount", 0)
-            if prob:
-                max_probability = max(max_probability, prob)
-            if amount:
-                total_rain += amount
-
-        skip = False
-        reason = ""
-        if max_probability >= 70 and total_rain >= 5:
-            skip = True
-            reason = (
-                f"Lluvia muy probable ({max_probability}%) con {total_rain:.1f}mm esperados en 48h"
-            )
-        elif max_probability >= 50 and total_rain >= 10:
-            skip = True
-            reason = (
-                f"Lluvia probable ({max_probability}%) con {total_rain:.1f}mm esperados en 48h"
-            )
-        elif total_rain >= 15:
-            skip = True
-            reason = (
-                f"Se esperan {total_rain:.1f}mm de lluvia en las próximas 48h"
-            )
-
+    if weather_forecast.get("status") != "success":
         return {
-            "skip_irrigation": skip,
-            "reason": reason if skip else "No se espera lluvia significativa",
-            "rain_expected": max_probability >= 40,
-            "rain_probability": max_probability,
-            "rain_amount_mm": total_rain,
+            "skip_irrigation": False,
+            "reason": "No weather data available",
+            "rain_expected": False,
         }
 
-    except Exception as e:
-        logger.error(f"Error analyzing weather for irrigation: {e}")
+    forecast = weather_forecast.get("forecast", [])
+    if not forecast:
         return {
             "skip_irrigation": False,
-            "reason": f"Error analyzing weather: {str(e)}",
+            "reason": "No forecast data",
             "rain_expected": False,
         }
 
+    memo = _skip_memo.get(id(forecast))
+    if memo is not None and memo[0] is forecast:
+        return dict(memo[1])
+
+    upcoming_weather = forecast[:2]
+
+    # Missing/None fields count as 0; builtin reductions keep this to two passes.
+    max_probability = max(
+        (day.get("precipitation_probability") or 0 for day in upcoming_weather), default=0
+    )
+    total_rain = sum(day.get("precipitation_amount") or 0 for day in upcoming_weather)
+
+    skip = False
+    reason = ""
+    if max_probability >= 70 and total_rain >= 5:
+        skip = True
+        reason = (
+            f"Lluvia muy probable ({max_probability}%) con {total_rain:.1f}mm esperados en 48h"
+        )
+    elif max_probability >= 50 and total_rain >= 10:
+        skip = True
+        reason = (
+            f"Lluvia probable ({max_probability}%) con {total_rain:.1f}mm esperados en 48h"
+        )
+    elif total_rain >= 15:
+        skip = True
+        reason = (
+            f"Se esperan {total_rain:.1f}mm de lluvia en las próximas 48h"
+        )
+
+    result = {
+        "skip_irrigation": skip,
+        "reason": reason if skip else "No se espera lluvia significativa",
+        "rain_expected": max_probability >= 40,
+        "rain_probability": max_probability,
+        "rain_amount_mm": total_rain,
+    }
+    if len(_skip_memo) >= _SKIP_MEMO_MAX:
+        _skip_memo.clear()
+    _skip_memo[id(forecast)] = (forecast, result)
+    return dict(result)
+
 
 def get_irrigation_recommendation(
     weather_data: Dict, current_moisture: float
 ) -> Dict[str, Any]:
     """Get irrigation recommendation based on weather and current soil moisture."""
-    try:
-        current = weather_data.get("current", {})
-        temperature = current.get("temperature")
-        humidity = current.get("humidity")
-
-        rain_check = should_skip_irrigation(weather_data)
-
-        if current_moisture < 30:
-            urgency = "critical"
-            base_action = "irrigate_now"
-        elif current_moisture < 45:
-            urgency = "moderate"
-            base_action = "irrigate_soon"
-        else:
-            urgency = "low"
-            base_action = "monitor"
-
-        if rain_check["skip_irrigation"] and urgency != "critical":
-            final_action = "skip"
-            reason = f"Humedad actual: {current_moisture}%. {rain_check['reason']}"
-        elif temperature and temperature > 30 and current_moisture < 50:
-            final_action = "irrigate_soon"
-            reason = (
-                f"Temperatura alta ({temperature}°C) aumenta evaporación. Humedad: {current_moisture}%"
-            )
-        else:
-            final_action = base_action
-            reason = (
-                f"Humedad actual: {current_moisture}%. Temp: {temperature}°C, Humedad ambiental: {humidity}%"
-            )
+    current = weather_data.get("current") or _EMPTY
+    temperature = current.get("temperature")
+    humidity = current.get("humidity")
 
-        return {
-            "action": final_action,
-            "reason": reason,
-            "urgency": urgency,
-            "weather_considered": True,
-            "rain_forecast": rain_check,
-            "timestamp": datetime.now().isoformat(),
-        }
+    rain_check = should_skip_irrigation(weather_data)
 
-    except Exception as e:
-        logger.error(f"Error generating irrigation recommendation: {e}")
+    if current_moisture is None:
         return {
             "action": "monitor",
-            "reason": f"Error analyzing weather: {str(e)}",
+            "reason": "Humedad actual no disponible",
             "urgency": "unknown",
             "weather_considered": False,
-            "timestamp": datetime.now().isoformat(),
+            "rain_forecast": rain_check,
+            "timestamp": now_iso(),
         }
+
+    urgency, base_action = _MOISTURE_URGENCY[bisect_right(_MOISTURE_BINS, current_moisture)]
+
+    if rain_check["skip_irrigation"] and urgency != "critical":
+        final_action = "skip"
+        reason = f"Humedad actual: {current_moisture}%. {rain_check['reason']}"
+    elif temperature and temperature > 30 and current_moisture < 50:
+        final_action = "irrigate_soon"
+        reason = (
+            f"Temperatura alta ({temperature}°C) aumenta evaporación. Humedad: {current_moisture}%"
+        )
+    else:
+        final_action = base_action
+        reason = (
+            f"Humedad actual: {current_moisture}%. Temp: {temperature}°C, Humedad ambiental: {humidity}%"
+        )
+
+    return {
+        "action": final_action,
+        "reason": reason,
+        "urgency": urgency,
+        "weather_considered": True,
+        "rain_forecast": rain_check,
+        "timestamp": now_iso(),
+    }
+
+
+def clear_cache() -> None:
+    """Drop cached weather so the next lookup hits the API."""
+    get_weather_for_garden.cache_clear()
+    _skip_memo.clear()
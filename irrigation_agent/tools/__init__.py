@@ -12,6 +12,7 @@ from .tools_api import get_weather_forecast  # noqa: F401
 # Sensors
 from .sensors import (
     check_soil_moisture,
+    check_soil_moisture_many,
     check_water_tank_level,
     get_sensor_history,
 )  # noqa: F401
@@ -20,7 +21,11 @@ from .sensors import (
 from .control import trigger_irrigation  # noqa: F401
 
 # Notifications
-from .notifications import send_notification  # noqa: F401
+from .notifications import (
+    send_notification,
+    send_notification_sync,
+    send_notification_async,
+)  # noqa: F401
 
 # Analysis
 from .analysis import analyze_plant_health, get_system_status  # noqa: F401
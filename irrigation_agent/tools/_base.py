@@ -1,7 +1,18 @@
 import os
+import math
 import logging
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from irrigation_agent.config import iot_config, weather_config, notification_config
+from irrigation_agent.utils.json_utils import dumpb
 
 
 logging.basicConfig(level=logging.INFO)
@@ -14,6 +25,104 @@ if USE_SIMULATION:
 else:
     simulator = None  # type: ignore
 
+# Shared keep-alive session so repeated calls to the same host reuse
+# connections instead of paying a TCP/TLS handshake each time.
+# Mounted for both schemes: the IoT controller is usually plain HTTP on the LAN.
+http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+http_session.mount("https://", _http_adapter)
+http_session.mount("http://", _http_adapter)
+
+# IoT controller endpoints; base_url is fixed for the life of the process.
+_IOT_BASE_URL = iot_config.base_url
+SENSORS_URL_PREFIX = _IOT_BASE_URL + "/api/sensors/"
+TANK_URL = _IOT_BASE_URL + "/api/water-tank"
+IRRIGATE_URL = _IOT_BASE_URL + "/api/irrigate"
+HISTORY_URL_SUFFIX = "/history"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def post_json(url: str, payload: Any, timeout: float) -> requests.Response:
+    """POST ``payload`` as JSON on the shared session, encoded via orjson."""
+    return http_session.post(url, data=dumpb(payload), headers=_JSON_HEADERS, timeout=timeout)
+
+# Shared by tools that overlap independent sensor/Firestore reads, so
+# concurrent status calls reuse threads instead of spawning their own.
+io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tools-io")
+
+# Health bands: < 30 poor, < 50 fair, <= 80 good, otherwise fair. The last
+# bound is nudged just above 80 so bisect_right keeps 80 itself in "good".
+_HEALTH_BINS = (30, 50, math.nextafter(80, math.inf))
+_HEALTH_LABELS = ("poor", "fair", "good", "fair")
+
+
+def _classify_health(moisture: Optional[float]) -> str:
+    if moisture is None:
+        return "unknown"
+    return _health_label(moisture)
+
+
+# Keyed on the exact reading (not a truncated int) so the > 80 boundary is
+# preserved; readings repeat heavily across status sweeps.
+@lru_cache(maxsize=256)
+def _health_label(moisture: float) -> str:
+    return _HEALTH_LABELS[bisect_right(_HEALTH_BINS, moisture)]
+
+
+# Alert bands: < 20 critical, < 40 low, > 85 overwatered. Each rule is
+# (is_critical, message template) or None when no alert is raised.
+_SEVERITY_BINS = (20, 40, math.nextafter(85, math.inf))
+_SEVERITY_RULES = (
+    (True, "{} critically dehydrated ({}%)"),
+    (False, "{} moisture low ({}%)"),
+    None,
+    (False, "{} possibly overwatered ({}%)"),
+)
+
+
+def _moisture_alert(name: str, moisture: float) -> Optional[Tuple[bool, str]]:
+    """Return (is_critical, message) for an out-of-band reading, else None."""
+    rule = _SEVERITY_RULES[bisect_right(_SEVERITY_BINS, moisture)]
+    if rule is None:
+        return None
+    is_critical, template = rule
+    return is_critical, template.format(name, moisture)
+
+
+@dataclass(slots=True)
+class SensorResult:
+    """A single moisture reading passed between tools in-process.
+
+    Tool functions exposed to the agents still return plain dicts; call
+    ``to_dict()`` at that boundary.
+    """
+    plant: str
+    moisture_level: Optional[float]
+    timestamp: str
+    status: str
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "success"
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            "plant": self.plant,
+            "moisture_level": self.moisture_level,
+            "timestamp": self.timestamp,
+            "status": self.status,
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
+
 __all__ = [
     "logger",
     "USE_SIMULATION",
@@ -21,5 +130,13 @@ __all__ = [
     "iot_config",
     "weather_config",
     "notification_config",
+    "http_session",
+    "io_pool",
+    "post_json",
+    "SENSORS_URL_PREFIX",
+    "TANK_URL",
+    "IRRIGATE_URL",
+    "HISTORY_URL_SUFFIX",
+    "SensorResult",
 ]
 
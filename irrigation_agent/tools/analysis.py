@@ -1,8 +1,8 @@
-from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Tuple
 
-from ._base import logger
-from .sensors import get_sensor_history, check_soil_moisture, check_water_tank_level
+from irrigation_agent.utils.time_utils import now_iso
+from ._base import logger, USE_SIMULATION, simulator, _classify_health, _moisture_alert, io_pool
+from .sensors import get_sensor_history, read_soil_moisture_many, check_water_tank_level
 
 
 def analyze_plant_health(plant_name: str, image_path: Optional[str] = None) -> Dict[str, Any]:
@@ -11,20 +11,19 @@ def analyze_plant_health(plant_name: str, image_path: Optional[str] = None) -> D
     Currently based on recent moisture history. Image analysis can be added later.
     """
     try:
-        history = get_sensor_history(plant_name, hours=24)
-        if history["status"] == "error" or not history["history"]:
+        readings = _moisture_series(plant_name, hours=24)
+        if not readings:
             return {
                 "plant": plant_name,
                 "health_score": None,
                 "avg_moisture": None,
                 "issues": ["No sensor data available"],
                 "recommendations": ["Check sensor connectivity"],
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "status": "error",
             }
 
-        moisture_readings = [reading.get("moisture", 0) for reading in history["history"]]
-        avg_moisture = sum(moisture_readings) / len(moisture_readings)
+        avg_moisture, moisture_range = _moisture_stats(readings)
 
         issues = []
         recommendations = []
@@ -44,11 +43,9 @@ def analyze_plant_health(plant_name: str, image_path: Optional[str] = None) -> D
             issues.append("Possible overwatering")
             recommendations.append("Reduce irrigation frequency")
 
-        if len(moisture_readings) > 1:
-            variance = max(moisture_readings) - min(moisture_readings)
-            if variance > 30:
-                issues.append("High moisture volatility")
-                recommendations.append("Stabilize irrigation schedule")
+        if moisture_range > 30:
+            issues.append("High moisture volatility")
+            recommendations.append("Stabilize irrigation schedule")
 
         return {
             "plant": plant_name,
@@ -56,7 +53,7 @@ def analyze_plant_health(plant_name: str, image_path: Optional[str] = None) -> D
             "avg_moisture": round(avg_moisture, 1),
             "issues": issues,
             "recommendations": recommendations,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "success",
         }
     except Exception as e:
@@ -67,52 +64,82 @@ def analyze_plant_health(plant_name: str, image_path: Optional[str] = None) -> D
             "avg_moisture": None,
             "issues": [str(e)],
             "recommendations": [],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "error",
             "error": str(e),
         }
 
 
-def get_system_status() -> Dict[str, Any]:
-    """Compute overall system status including tank and plants health."""
-    try:
-        tank_status = check_water_tank_level()
+def get_system_status(include_plants: bool = True) -> Dict[str, Any]:
+    """Compute overall system status including tank and plants health.
 
+    With ``include_plants=False`` a tank sensor error returns a critical
+    status immediately without polling plant sensors; latency-sensitive
+    alerting loops can use this. Callers wanting the full picture keep
+    the default.
+    """
+    try:
         # TODO: make plant list configurable
         plants = ["tomato", "basil", "lettuce", "pepper"]
 
+        if include_plants:
+            # Tank and plant reads are independent; overlap their latency.
+            tank_future = io_pool.submit(check_water_tank_level)
+            moisture_by_plant = read_soil_moisture_many(plants)
+            tank_status = tank_future.result()
+        else:
+            tank_status = check_water_tank_level()
+            if tank_status["status"] == "error":
+                return {
+                    "overall_health": "critical",
+                    "water_tank": {
+                        "level_percentage": None,
+                        "capacity_liters": None,
+                        "status": "error",
+                    },
+                    "plant_status": {},
+                    "critical_issues": ["Water tank sensor error"],
+                    "warnings": [],
+                    "timestamp": now_iso(),
+                    "status": "success",
+                }
+            moisture_by_plant = read_soil_moisture_many(plants)
+
         plant_status: Dict[str, Any] = {}
         critical_issues = []
         warnings = []
 
         for plant in plants:
-            moisture_data = check_soil_moisture(plant)
-            if moisture_data["status"] == "error":
+            reading = moisture_by_plant[plant]
+            if not reading.ok:
                 critical_issues.append(f"Sensor error for {plant}")
                 plant_status[plant] = {"moisture": None, "health": "unknown"}
             else:
-                moisture = moisture_data["moisture_level"]
+                moisture = reading.moisture_level
                 plant_status[plant] = {
                     "moisture": moisture,
                     "health": _classify_health(moisture),
                 }
                 if moisture is not None:
-                    if moisture < 20:
-                        critical_issues.append(f"{plant} critically dehydrated ({moisture}%)")
-                    elif moisture < 40:
-                        warnings.append(f"{plant} moisture low ({moisture}%)")
-                    elif moisture > 85:
-                        warnings.append(f"{plant} possibly overwatered ({moisture}%)")
-
-        if tank_status["status"] == "success":
-            level = tank_status["level_percentage"]
-            if level is not None:
-                if level < 10:
-                    critical_issues.append(f"Water tank critical ({level}%)")
-                elif level < 30:
-                    warnings.append(f"Water tank low ({level}%)")
-        else:
+                    alert = _moisture_alert(plant, moisture)
+                    if alert is not None:
+                        is_critical, text = alert
+                        (critical_issues if is_critical else warnings).append(text)
+
+        level = tank_status.get("level_percentage")
+        if tank_status["status"] != "success":
+            tank_state = "error"
             critical_issues.append("Water tank sensor error")
+        elif level is None:
+            tank_state = "unknown"
+        elif level < 10:
+            tank_state = "critical"
+            critical_issues.append(f"Water tank critical ({level}%)")
+        elif level < 30:
+            tank_state = "low"
+            warnings.append(f"Water tank low ({level}%)")
+        else:
+            tank_state = "normal"
 
         if critical_issues:
             overall_health = "critical"
@@ -124,18 +151,14 @@ def get_system_status() -> Dict[str, Any]:
         return {
             "overall_health": overall_health,
             "water_tank": {
-                "level_percentage": tank_status.get("level_percentage"),
+                "level_percentage": level,
                 "capacity_liters": tank_status.get("capacity_liters"),
-                "status": "critical"
-                if tank_status.get("level_percentage", 100) < 10
-                else "low"
-                if tank_status.get("level_percentage", 100) < 30
-                else "normal",
+                "status": tank_state,
             },
             "plant_status": plant_status,
             "critical_issues": critical_issues,
             "warnings": warnings,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "success",
         }
     except Exception as e:
@@ -146,20 +169,22 @@ def get_system_status() -> Dict[str, Any]:
             "plant_status": {},
             "critical_issues": [str(e)],
             "warnings": [],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "error",
             "error": str(e),
         }
 
 
-def _classify_health(moisture: Optional[float]) -> str:
-    if moisture is None:
-        return "unknown"
-    elif moisture < 30:
-        return "poor"
-    elif moisture < 50:
-        return "fair"
-    elif moisture <= 80:
-        return "good"
-    else:
-        return "fair"
+def _moisture_series(plant_name: str, hours: int) -> Optional[list]:
+    """Return the moisture readings for the window, or None on sensor error."""
+    if USE_SIMULATION and simulator is not None:
+        return simulator.get_moisture_series(plant_name, hours)
+    history = get_sensor_history(plant_name, hours=hours)
+    if history["status"] == "error":
+        return None
+    return [reading.get("moisture", 0) for reading in history["history"]]
+
+
+def _moisture_stats(values: Sequence[float]) -> Tuple[float, float]:
+    """Return (mean, max - min) of a non-empty list of readings."""
+    return sum(values) / len(values), max(values) - min(values)
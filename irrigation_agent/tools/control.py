@@ -1,8 +1,8 @@
-﻿from datetime import datetime
-from typing import Dict, Any
+﻿from typing import Dict, Any
 import requests
 
-from ._base import logger, USE_SIMULATION, simulator, iot_config
+from irrigation_agent.utils.time_utils import now_iso
+from ._base import logger, USE_SIMULATION, simulator, iot_config, post_json, IRRIGATE_URL
 
 
 def trigger_irrigation(plant_name: str, duration_seconds: int) -> Dict[str, Any]:
@@ -25,14 +25,14 @@ def trigger_irrigation(plant_name: str, duration_seconds: int) -> Dict[str, Any]
                     "plant": plant_name,
                     "duration_seconds": duration_seconds,
                     "status": "success",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso(),
                     "simulated": True,
                 }
             return {
                 "plant": plant_name,
                 "duration_seconds": duration_seconds,
                 "status": "error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "error": "Simulation failed",
                 "simulated": True,
             }
@@ -42,22 +42,22 @@ def trigger_irrigation(plant_name: str, duration_seconds: int) -> Dict[str, Any]
                 "plant": plant_name,
                 "duration_seconds": duration_seconds,
                 "status": "error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "error": str(e),
                 "simulated": True,
             }
 
     try:
-        url = f"{iot_config.base_url}/api/irrigate"
+        url = IRRIGATE_URL
         payload = {"plant": plant_name, "duration": duration_seconds}
-        response = requests.post(url, json=payload, timeout=iot_config.pump_timeout)
+        response = post_json(url, payload, timeout=iot_config.pump_timeout)
         response.raise_for_status()
         logger.info(f"Irrigation started for {plant_name} - {duration_seconds}s")
         return {
             "plant": plant_name,
             "duration_seconds": duration_seconds,
             "status": "success",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
     except requests.RequestException as e:
         logger.error(f"Error triggering irrigation for {plant_name}: {e}")
@@ -65,6 +65,6 @@ def trigger_irrigation(plant_name: str, duration_seconds: int) -> Dict[str, Any]
             "plant": plant_name,
             "duration_seconds": duration_seconds,
             "status": "error",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "error": str(e),
         }
@@ -1,13 +1,17 @@
-﻿from datetime import datetime
-from typing import Dict, Any
+﻿from typing import Dict, Any, Optional
 
-from ._base import logger, USE_SIMULATION, simulator
+from irrigation_agent.utils.time_utils import now_iso
+from ._base import logger, USE_SIMULATION, simulator, _classify_health, _moisture_alert, io_pool
 from irrigation_agent.service.weather_service import (
     get_weather_for_garden,
     get_irrigation_recommendation,
 )
 
 
+# Subset of the _plant_summary payload echoed back in recommendations.
+_RECOMMENDATION_PLANT_FIELDS = ("garden_id", "plant_id", "plant_name", "current_moisture", "health")
+
+
 def _sim_enabled() -> bool:
     try:
         return bool(simulator and (getattr(simulator, 'use_firestore', False) or USE_SIMULATION))
@@ -23,7 +27,7 @@ def get_all_gardens() -> Dict[str, Any]:
                 "gardens": gardens,
                 "total_gardens": len(gardens),
                 "status": "success",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
         else:
             return {
@@ -31,7 +35,7 @@ def get_all_gardens() -> Dict[str, Any]:
                 "total_gardens": 0,
                 "status": "error",
                 "error": "Real IoT mode not implemented for gardens yet",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
     except Exception as e:
         logger.error(f"Error getting all gardens: {e}")
@@ -40,7 +44,7 @@ def get_all_gardens() -> Dict[str, Any]:
             "total_gardens": 0,
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
 
 
@@ -52,73 +56,39 @@ def get_garden_status(garden_id: str) -> Dict[str, Any]:
                 return {
                     "status": "error",
                     "error": f"Garden {garden_id} not found",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso(),
                 }
             plants = simulator.get_garden_plants(garden_id)
-            plant_status = {}
-            critical_issues = []
-            warnings = []
-            for plant_id, plant_data in plants.items():
-                moisture = plant_data.get("current_moisture")
-                plant_status[plant_id] = {
-                    "name": plant_data.get("name", plant_id),
-                    "moisture": moisture,
-                    "health": _classify_health(moisture),
-                    "last_irrigation": plant_data.get("last_irrigation"),
-                    "last_updated": str(plant_data.get("last_updated", "")),
-                }
-                if moisture is not None:
-                    if moisture < 20:
-                        critical_issues.append(f"{plant_id} critically dehydrated ({moisture}%)")
-                    elif moisture < 40:
-                        warnings.append(f"{plant_id} moisture low ({moisture}%)")
-                    elif moisture > 85:
-                        warnings.append(f"{plant_id} possibly overwatered ({moisture}%)")
-            if critical_issues:
-                overall_health = "critical"
-            elif warnings:
-                overall_health = "warning"
-            else:
-                overall_health = "healthy"
-            return {
-                "garden_id": garden_id,
-                "garden_name": garden.get("name"),
-                "personality": garden.get("personality"),
-                "location": garden.get("location"),
-                "plant_type": garden.get("plant_type"),
-                "area_m2": garden.get("area_m2"),
-                "overall_health": overall_health,
-                "plant_status": plant_status,
-                "critical_issues": critical_issues,
-                "warnings": warnings,
-                "total_plants": len(plants),
-                "status": "success",
-                "timestamp": datetime.now().isoformat(),
-            }
+            return _build_garden_status(garden_id, garden, plants)
         else:
             return {
                 "status": "error",
                 "error": "Real IoT mode not implemented for gardens yet",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
     except Exception as e:
         logger.error(f"Error getting garden {garden_id} status: {e}")
-        return {"status": "error", "error": str(e), "timestamp": datetime.now().isoformat()}
+        return {"status": "error", "error": str(e), "timestamp": now_iso()}
 
 
 def get_all_gardens_status() -> Dict[str, Any]:
     try:
         if _sim_enabled():
+            # The garden list and the plant collection-group query are
+            # independent reads; overlap them.
+            plants_future = io_pool.submit(simulator.get_all_garden_plants)
             gardens_data = simulator.get_all_gardens()
+            plants_by_garden = plants_future.result()
+            # One stamp for the whole sweep so nested garden payloads agree.
+            timestamp = now_iso()
             all_gardens_status = {}
             total_critical = 0
             total_warnings = 0
-            for gid in gardens_data.keys():
-                garden_status = get_garden_status(gid)
+            for gid, garden in gardens_data.items():
+                garden_status = _build_garden_status(gid, garden, plants_by_garden.get(gid, {}), timestamp)
                 all_gardens_status[gid] = garden_status
-                if garden_status.get("status") == "success":
-                    total_critical += len(garden_status.get("critical_issues", []))
-                    total_warnings += len(garden_status.get("warnings", []))
+                total_critical += len(garden_status["critical_issues"])
+                total_warnings += len(garden_status["warnings"])
             overall_health = "healthy"
             if total_critical > 0:
                 overall_health = "critical"
@@ -130,17 +100,64 @@ def get_all_gardens_status() -> Dict[str, Any]:
                 "gardens": all_gardens_status,
                 "total_critical_issues": total_critical,
                 "total_warnings": total_warnings,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
         else:
             return {
                 "status": "error",
                 "error": "Real IoT mode not implemented for gardens yet",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
     except Exception as e:
         logger.error(f"Error getting all gardens status: {e}")
-        return {"status": "error", "error": str(e), "timestamp": datetime.now().isoformat()}
+        return {"status": "error", "error": str(e), "timestamp": now_iso()}
+
+
+def _build_garden_status(
+    garden_id: str,
+    garden: Dict[str, Any],
+    plants: Dict[str, Any],
+    timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Assemble a garden's status payload from already-loaded documents."""
+    plant_status = {}
+    critical_issues = []
+    warnings = []
+    for plant_id, plant_data in plants.items():
+        moisture = plant_data.get("current_moisture")
+        plant_status[plant_id] = {
+            "name": plant_data.get("name", plant_id),
+            "moisture": moisture,
+            "health": _classify_health(moisture),
+            "last_irrigation": plant_data.get("last_irrigation"),
+            "last_updated": str(plant_data.get("last_updated", "")),
+        }
+        if moisture is not None:
+            alert = _moisture_alert(plant_id, moisture)
+            if alert is not None:
+                is_critical, text = alert
+                (critical_issues if is_critical else warnings).append(text)
+    if critical_issues:
+        overall_health = "critical"
+    elif warnings:
+        overall_health = "warning"
+    else:
+        overall_health = "healthy"
+    return {
+        "garden_id": garden_id,
+        "garden_name": garden.get("name"),
+        "personality": garden.get("personality"),
+        "location": garden.get("location"),
+        "plant_type": garden.get("plant_type"),
+        "area_m2": garden.get("area_m2"),
+        "overall_health": overall_health,
+        "plant_status": plant_status,
+        "critical_issues": critical_issues,
+        "warnings": warnings,
+        "total_plants": len(plants),
+        "status": "success",
+        "timestamp": timestamp or now_iso(),
+    }
 
 
 def get_plant_in_garden(garden_id: str, plant_id: str) -> Dict[str, Any]:
@@ -148,55 +165,45 @@ def get_plant_in_garden(garden_id: str, plant_id: str) -> Dict[str, Any]:
         if _sim_enabled():
             plant = simulator.get_garden_plant(garden_id, plant_id)
             if not plant:
-                return {"status": "error", "error": "Plant not found", "timestamp": datetime.now().isoformat()}
-            moisture = plant.get("current_moisture")
-            return {
-                "garden_id": garden_id,
-                "plant_id": plant_id,
-                "plant_name": plant.get("name", plant_id),
-                "current_moisture": moisture,
-                "health": _classify_health(moisture),
-                "last_irrigation": plant.get("last_irrigation"),
-                "last_updated": str(plant.get("last_updated", "")),
-                "status": "success",
-                "timestamp": datetime.now().isoformat(),
-            }
+                return {"status": "error", "error": "Plant not found", "timestamp": now_iso()}
+            return _plant_summary(garden_id, plant_id, plant)
         else:
             return {
                 "status": "error",
                 "error": "Real IoT mode not implemented for gardens yet",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
     except Exception as e:
         logger.error(f"Error getting plant {plant_id} in garden {garden_id}: {e}")
-        return {"status": "error", "error": str(e), "timestamp": datetime.now().isoformat()}
+        return {"status": "error", "error": str(e), "timestamp": now_iso()}
 
 
 def get_garden_weather(garden_id: str) -> Dict[str, Any]:
     try:
         garden = simulator.get_garden(garden_id) if simulator else None
-        if not garden:
-            return {"status": "error", "error": f"Garden {garden_id} not found", "timestamp": datetime.now().isoformat()}
-        latitude = garden.get("latitude")
-        longitude = garden.get("longitude")
-        if not latitude or not longitude:
-            return {"status": "error", "error": "Garden location coordinates not available", "timestamp": datetime.now().isoformat()}
-        weather_data = get_weather_for_garden(latitude, longitude)
-        weather_data["garden_id"] = garden_id
-        weather_data["garden_name"] = garden.get("name")
-        weather_data["garden_location"] = garden.get("location")
-        return weather_data
     except Exception as e:
         logger.error(f"Error getting weather for garden {garden_id}: {e}")
-        return {"status": "error", "error": str(e), "timestamp": datetime.now().isoformat()}
+        return {"status": "error", "error": str(e), "timestamp": now_iso()}
+    return _garden_weather(garden_id, garden)
 
 
 def get_irrigation_recommendation_with_weather(garden_id: str, plant_id: str) -> Dict[str, Any]:
     try:
-        plant_data = get_plant_in_garden(garden_id, plant_id)
-        if plant_data.get("status") != "success":
-            return plant_data
-        weather_data = get_garden_weather(garden_id)
+        if not _sim_enabled():
+            return {
+                "status": "error",
+                "error": "Real IoT mode not implemented for gardens yet",
+                "timestamp": now_iso(),
+            }
+        # The weather lookup only needs the garden document, so run it
+        # alongside the plant read instead of after it.
+        weather_future = io_pool.submit(get_garden_weather, garden_id)
+        plant = simulator.get_garden_plant(garden_id, plant_id)
+        if not plant:
+            weather_future.cancel()
+            return {"status": "error", "error": "Plant not found", "timestamp": now_iso()}
+        plant_data = _plant_summary(garden_id, plant_id, plant)
+        weather_data = weather_future.result()
         if weather_data.get("status") != "success":
             moisture = plant_data.get("current_moisture", 0)
             return {
@@ -205,16 +212,10 @@ def get_irrigation_recommendation_with_weather(garden_id: str, plant_id: str) ->
                 "weather_available": False,
                 "plant_data": plant_data,
                 "status": "success",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
         recommendation = get_irrigation_recommendation(weather_data, plant_data.get("current_moisture", 0))
-        recommendation["plant_data"] = {
-            "garden_id": garden_id,
-            "plant_id": plant_id,
-            "plant_name": plant_data.get("plant_name"),
-            "current_moisture": plant_data.get("current_moisture"),
-            "health": plant_data.get("health"),
-        }
+        recommendation["plant_data"] = {key: plant_data[key] for key in _RECOMMENDATION_PLANT_FIELDS}
         recommendation["weather_data"] = {
             "current_temp": weather_data.get("current", {}).get("temperature"),
             "current_humidity": weather_data.get("current", {}).get("humidity"),
@@ -223,18 +224,44 @@ def get_irrigation_recommendation_with_weather(garden_id: str, plant_id: str) ->
         return recommendation
     except Exception as e:
         logger.error(f"Error getting recommendation for {plant_id} in {garden_id}: {e}")
-        return {"status": "error", "error": str(e), "timestamp": datetime.now().isoformat()}
+        return {"status": "error", "error": str(e), "timestamp": now_iso()}
 
 
+def _plant_summary(garden_id: str, plant_id: str, plant: Dict[str, Any]) -> Dict[str, Any]:
+    moisture = plant.get("current_moisture")
+    return {
+        "garden_id": garden_id,
+        "plant_id": plant_id,
+        "plant_name": plant.get("name", plant_id),
+        "current_moisture": moisture,
+        "health": _classify_health(moisture),
+        "last_irrigation": plant.get("last_irrigation"),
+        "last_updated": str(plant.get("last_updated", "")),
+        "status": "success",
+        "timestamp": now_iso(),
+    }
 
-def _classify_health(moisture):
-    if moisture is None:
-        return "unknown"
-    elif moisture < 30:
-        return "poor"
-    elif moisture < 50:
-        return "fair"
-    elif moisture <= 80:
-        return "good"
-    else:
-        return "fair"
+
+def _garden_weather(garden_id: str, garden: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Weather for an already-loaded garden, tagged with the garden's identity."""
+    try:
+        if not garden:
+            return {"status": "error", "error": f"Garden {garden_id} not found", "timestamp": now_iso()}
+        latitude = garden.get("latitude")
+        longitude = garden.get("longitude")
+        if not latitude or not longitude:
+            return {"status": "error", "error": "Garden location coordinates not available", "timestamp": now_iso()}
+        weather_data = dict(_weather_from_coords(latitude, longitude))
+        weather_data["garden_id"] = garden_id
+        weather_data["garden_name"] = garden.get("name")
+        weather_data["garden_location"] = garden.get("location")
+        return weather_data
+    except Exception as e:
+        logger.error(f"Error getting weather for garden {garden_id}: {e}")
+        return {"status": "error", "error": str(e), "timestamp": now_iso()}
+
+
+# get_weather_for_garden caches per ~100 m cell, so callers get a shared dict
+# and must copy it before adding fields (see _garden_weather).
+def _weather_from_coords(latitude: float, longitude: float) -> Dict[str, Any]:
+    return get_weather_for_garden(latitude, longitude)
@@ -1,80 +1,303 @@
 ﻿
+import asyncio
+import smtplib
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
-import requests
+from email.message import EmailMessage
+from typing import Dict, Any, List, Tuple, Callable, Iterator
 
-from ._base import notification_config, logger
+from irrigation_agent.utils.time_utils import now_iso
+from ._base import notification_config, logger, post_json
+
+
+_VALID_PRIORITIES = frozenset({"low", "medium", "high", "critical"})
+
+# Built once at import; escapes keep the glyphs intact regardless of file encoding.
+_PRIORITY_EMOJI: Dict[str, str] = {
+    "critical": "\U0001f6a8",
+    "high": "\u26a0\ufe0f",
+    "medium": "\u2139\ufe0f",
+    "low": "\u2705",
+}
+
+# Full header for each priority, so a send is a single concatenation. The
+# Markdown variant is only used when the message itself carries markup or
+# the alert is critical; everything else goes out as plain text so Telegram
+# skips entity parsing.
+_BANNERS: Dict[str, str] = {p: f"{e} *{p.upper()}*\n\n" for p, e in _PRIORITY_EMOJI.items()}
+_PLAIN_BANNERS: Dict[str, str] = {p: f"{e} {p.upper()}\n\n" for p, e in _PRIORITY_EMOJI.items()}
+_MARKDOWN_CHARS = frozenset("*_`[")
+
+# Plain-text alert body; no attachments, so a single-part EmailMessage suffices.
+_EMAIL_TEMPLATE = (
+    "Priority: {priority}\n"
+    "Time: {ts}\n"
+    "\n"
+    "{message}\n"
+    "\n"
+    "---\n"
+    "Intelligent Irrigation System\n"
+)
+
+# Telegram/SMTP I/O runs here so callers never block on network timeouts.
+# The semaphore caps queued deliveries to bound memory during alert storms.
+_SEND_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="notif")
+_MAX_PENDING = 1000
+_pending = threading.BoundedSemaphore(_MAX_PENDING)
+# Delivered inline rather than queued.
+_SYNC_PRIORITIES = frozenset({"critical"})
+
+# Separate pool for per-channel fan-out so a delivery running on _SEND_POOL
+# never waits on work queued behind it in the same pool.
+_CHANNEL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="notif-ch")
+
+# Authenticated SMTP sessions kept between alerts, keyed by (server, port),
+# so a burst of critical alerts skips the connect/STARTTLS/login round trips.
+_SMTP_MAX_IDLE = 2
+_smtp_pool: Dict[Tuple[str, int], List[smtplib.SMTP]] = {}
+_smtp_lock = threading.Lock()
 
 
 def send_notification(message: str, priority: str = "medium") -> Dict[str, Any]:
-    """Send notification to user with priority classification."""
-    priority = (priority or "").lower()
-    if priority not in ["low", "medium", "high", "critical"]:
-        priority = "medium"
+    """Send notification to user with priority classification.
 
-    channels_used = ["log"]
-    logger.info(f"[{priority.upper()}] {message}")
+    Telegram/email delivery for high and lower priorities runs on a
+    background pool so the caller returns immediately. Critical alerts are
+    delivered before returning, so they are not lost if the process dies
+    right after raising them. Use ``send_notification_sync`` to wait for
+    any priority.
+    """
+    sender = _DISPATCH.get(priority) or _DISPATCH[_normalize_priority(priority)]
+    return sender(message)
 
-    if notification_config.has_telegram and priority in ["high", "critical"]:
-        try:
-            _send_telegram_notification(message, priority)
-            channels_used.append("telegram")
-        except Exception as e:
-            logger.error(f"Failed to send Telegram notification: {e}")
 
-    if notification_config.has_email and priority == "critical":
-        try:
-            _send_email_notification(message, priority)
-            channels_used.append("email")
-        except Exception as e:
-            logger.error(f"Failed to send email notification: {e}")
+def send_notification_sync(message: str, priority: str = "medium") -> Dict[str, Any]:
+    """Send notification and wait until every channel has been attempted."""
+    priority = _normalize_priority(priority)
+    logger.info(f"[{priority.upper()}] {message}")
+
+    channels_used = ["log"] + _deliver(message, priority, _CHANNELS[priority])
 
     return {
         "message": message,
         "priority": priority,
         "sent": True,
+        "queued": False,
         "channels": channels_used,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "status": "success",
     }
 
 
+async def send_notification_async(message: str, priority: str = "medium") -> Dict[str, Any]:
+    """Awaitable ``send_notification_sync`` for async callers; runs off the event loop."""
+    return await asyncio.to_thread(send_notification_sync, message, priority)
+
+
+def rebuild_dispatch() -> None:
+    """Recompute per-priority routing; call after changing notification_config."""
+    global _CHANNELS, _DISPATCH
+    _CHANNELS = {p: _external_channels(p) for p in _VALID_PRIORITIES}
+    _DISPATCH = {p: _build_sender(p, _CHANNELS[p]) for p in _VALID_PRIORITIES}
+
+
+def _build_sender(priority: str, channels: Tuple[str, ...]) -> Callable[[str], Dict[str, Any]]:
+    """Return a sender with the channel routing for ``priority`` baked in."""
+    label = f"[{priority.upper()}] "
+
+    if not channels:
+        def send(message: str) -> Dict[str, Any]:
+            logger.info(label + message)
+            return {
+                "message": message,
+                "priority": priority,
+                "sent": True,
+                "queued": False,
+                "channels": ["log"],
+                "timestamp": now_iso(),
+                "status": "success",
+            }
+        return send
+
+    if priority in _SYNC_PRIORITIES:
+        def send(message: str) -> Dict[str, Any]:
+            logger.info(label + message)
+            return {
+                "message": message,
+                "priority": priority,
+                "sent": True,
+                "queued": False,
+                "channels": ["log", *_deliver(message, priority, channels)],
+                "timestamp": now_iso(),
+                "status": "success",
+            }
+        return send
+
+    def send(message: str) -> Dict[str, Any]:
+        logger.info(label + message)
+        if not _submit(message, priority, channels):
+            return {
+                "message": message,
+                "priority": priority,
+                "sent": False,
+                "queued": False,
+                "channels": ["log"],
+                "timestamp": now_iso(),
+                "status": "dropped",
+                "error": "Notification backlog full",
+            }
+        # Delivery outcome is only known later, on the background pool
+        return {
+            "message": message,
+            "priority": priority,
+            "sent": False,
+            "queued": True,
+            "channels": ["log", *channels],
+            "timestamp": now_iso(),
+            "status": "queued",
+        }
+    return send
+
+
+def _normalize_priority(priority: str) -> str:
+    priority = (priority or "").lower()
+    return priority if priority in _VALID_PRIORITIES else "medium"
+
+
+def _external_channels(priority: str) -> Tuple[str, ...]:
+    channels = []
+    if notification_config.has_telegram and priority in ("high", "critical"):
+        channels.append("telegram")
+    if notification_config.has_email and priority == "critical":
+        channels.append("email")
+    return tuple(channels)
+
+
+def _submit(message: str, priority: str, channels: Tuple[str, ...]) -> bool:
+    """Queue delivery on the background pool; drop it if the backlog is full."""
+    if not _pending.acquire(blocking=False):
+        logger.warning(f"Notification backlog full, dropping [{priority.upper()}] {message}")
+        return False
+    future = _SEND_POOL.submit(_deliver, message, priority, channels)
+    future.add_done_callback(lambda _f: _pending.release())
+    return True
+
+
+def _deliver(message: str, priority: str, channels: Tuple[str, ...]) -> List[str]:
+    """Send to each of ``channels``; return those that succeeded.
+
+    With several channels the sends overlap, so latency is the slowest
+    channel (usually the SMTP handshake) rather than the sum.
+    """
+    if len(channels) == 1:
+        return list(channels) if _try_send(channels[0], message, priority) else []
+
+    futures = [(ch, _CHANNEL_POOL.submit(_try_send, ch, message, priority)) for ch in channels]
+    return [ch for ch, future in futures if future.result()]
+
+
+def _try_send(channel: str, message: str, priority: str) -> bool:
+    sender, label = _CHANNEL_SENDERS[channel]
+    try:
+        sender(message, priority)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to send {label} notification: {e}")
+        return False
+
+
 def _send_telegram_notification(message: str, priority: str) -> None:
     url = f"https://api.telegram.org/bot{notification_config.telegram_bot_token}/sendMessage"
-    emoji_map = {"critical": "🚨", "high": "⚠️", "medium": "ℹ️", "low": "✅"}
-    emoji = emoji_map.get(priority, "ℹ️")
-    formatted_message = f"{emoji} *{priority.upper()}*\n\n{message}"
-    payload = {
-        "chat_id": notification_config.telegram_chat_id,
-        "text": formatted_message,
-        "parse_mode": "Markdown",
-    }
-    response = requests.post(url, json=payload, timeout=10)
+    payload = {"chat_id": notification_config.telegram_chat_id}
+    if priority == "critical" or not _MARKDOWN_CHARS.isdisjoint(message):
+        payload["text"] = _BANNERS.get(priority, _BANNERS["medium"]) + message
+        payload["parse_mode"] = "Markdown"
+    else:
+        payload["text"] = _PLAIN_BANNERS.get(priority, _PLAIN_BANNERS["medium"]) + message
+    response = post_json(url, payload, timeout=10)
     response.raise_for_status()
 
 
 def _send_email_notification(message: str, priority: str) -> None:
-    import smtplib
-    from email.mime.text import MIMEText
-    from email.mime.multipart import MIMEMultipart
-
-    msg = MIMEMultipart()
+    msg = EmailMessage()
     msg["From"] = notification_config.smtp_username
     msg["To"] = notification_config.notification_email
     msg["Subject"] = f"[{priority.upper()}] Irrigation System Alert"
+    msg.set_content(_EMAIL_TEMPLATE.format(
+        priority=priority.upper(),
+        ts=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        message=message,
+    ))
+
+    with _borrow_smtp() as server:
+        server.send_message(msg)
 
-    body = f"""
-    Priority: {priority.upper()}
-    {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-    {message}
+@contextmanager
+def _borrow_smtp() -> Iterator[smtplib.SMTP]:
+    """Yield an authenticated SMTP connection, reusing an idle one when alive.
 
-    ---
-    Intelligent Irrigation System
+    Connections go back to the pool after a successful send and are closed
+    on any error, so a broken session is never handed out twice.
     """
-    msg.attach(MIMEText(body, "plain"))
+    key = (notification_config.smtp_server, notification_config.smtp_port)
+    server = None
+    while server is None:
+        with _smtp_lock:
+            idle = _smtp_pool.get(key)
+            candidate = idle.pop() if idle else None
+        if candidate is None:
+            break
+        if _smtp_alive(candidate):
+            server = candidate
+        else:
+            _smtp_close(candidate)
 
-    with smtplib.SMTP(notification_config.smtp_server, notification_config.smtp_port) as server:
-        server.starttls()
-        server.login(notification_config.smtp_username, notification_config.smtp_password)
-        server.send_message(msg)
+    if server is None:
+        server = smtplib.SMTP(*key, timeout=30)
+        try:
+            server.starttls()
+            server.login(notification_config.smtp_username, notification_config.smtp_password)
+        except Exception:
+            _smtp_close(server)
+            raise
+
+    try:
+        yield server
+    except Exception:
+        _smtp_close(server)
+        raise
+
+    with _smtp_lock:
+        idle = _smtp_pool.setdefault(key, [])
+        if len(idle) < _SMTP_MAX_IDLE:
+            idle.append(server)
+            server = None
+    if server is not None:
+        _smtp_close(server)
+
+
+def _smtp_alive(server: smtplib.SMTP) -> bool:
+    try:
+        return server.noop()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
+
+
+def _smtp_close(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+_CHANNEL_SENDERS: Dict[str, Tuple[Callable[[str, str], None], str]] = {
+    "telegram": (_send_telegram_notification, "Telegram"),
+    "email": (_send_email_notification, "email"),
+}
+
+_CHANNELS: Dict[str, Tuple[str, ...]] = {}
+_DISPATCH: Dict[str, Callable[[str], Dict[str, Any]]] = {}
+rebuild_dispatch()
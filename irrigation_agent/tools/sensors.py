@@ -1,50 +1,69 @@
 ﻿# Delegating wrappers to legacy implementations for staged refactor
-from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import requests
 
-from ._base import logger, USE_SIMULATION, simulator, iot_config
+from irrigation_agent.utils.json_utils import loads as json_loads, JSONDecodeError
+from irrigation_agent.utils.time_utils import now_iso
+from ._base import (
+    logger,
+    USE_SIMULATION,
+    simulator,
+    iot_config,
+    http_session,
+    io_pool,
+    SENSORS_URL_PREFIX,
+    TANK_URL,
+    HISTORY_URL_SUFFIX,
+    SensorResult,
+)
 
 
 def check_soil_moisture(plant_name: str) -> Dict[str, Any]:
     """Read current soil moisture level from IoT sensor or simulation."""
+    return read_soil_moisture(plant_name).to_dict()
+
+
+def check_soil_moisture_many(plant_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Read soil moisture for several plants at once, keyed by plant name.
+
+    Simulation mode uses one batched simulator read; otherwise the sensor
+    requests run concurrently so total latency is that of the slowest one.
+    """
+    return {name: reading.to_dict() for name, reading in read_soil_moisture_many(plant_names).items()}
+
+
+def read_soil_moisture(plant_name: str) -> SensorResult:
+    """``check_soil_moisture`` returning a SensorResult, for in-process callers."""
     if USE_SIMULATION:
         moisture = simulator.get_plant_moisture(plant_name) if simulator else None
-        if moisture is not None:
-            return {
-                "plant": plant_name,
-                "moisture_level": moisture,
-                "timestamp": datetime.now().isoformat(),
-                "status": "success",
-            }
-        return {
-            "plant": plant_name,
-            "moisture_level": None,
-            "timestamp": datetime.now().isoformat(),
-            "status": "error",
-            "error": f"Plant {plant_name} not found in simulation data",
-        }
+        return _simulated_reading(plant_name, moisture)
 
     try:
-        url = f"{iot_config.base_url}/api/sensors/{plant_name}"
-        response = requests.get(url, timeout=iot_config.sensor_timeout)
+        url = SENSORS_URL_PREFIX + plant_name
+        response = http_session.get(url, timeout=iot_config.sensor_timeout)
         response.raise_for_status()
-        data = response.json()
-        return {
-            "plant": plant_name,
-            "moisture_level": data.get("moisture", 0),
-            "timestamp": datetime.now().isoformat(),
-            "status": "success",
-        }
-    except requests.RequestException as e:
+        data = json_loads(response.content)
+        return SensorResult(plant_name, data.get("moisture", 0), now_iso(), "success")
+    except (requests.RequestException, JSONDecodeError) as e:
         logger.error(f"Error reading soil moisture for {plant_name}: {e}")
-        return {
-            "plant": plant_name,
-            "moisture_level": None,
-            "timestamp": datetime.now().isoformat(),
-            "status": "error",
-            "error": str(e),
-        }
+        return SensorResult(plant_name, None, now_iso(), "error", str(e))
+
+
+def read_soil_moisture_many(plant_names: List[str]) -> Dict[str, SensorResult]:
+    """``check_soil_moisture_many`` returning SensorResults, for in-process callers."""
+    if USE_SIMULATION:
+        levels = simulator.get_plants_moisture(plant_names) if simulator else {}
+        return {name: _simulated_reading(name, levels.get(name)) for name in plant_names}
+
+    return dict(zip(plant_names, io_pool.map(read_soil_moisture, plant_names)))
+
+
+def _simulated_reading(plant_name: str, moisture: Optional[float]) -> SensorResult:
+    if moisture is not None:
+        return SensorResult(plant_name, moisture, now_iso(), "success")
+    return SensorResult(
+        plant_name, None, now_iso(), "error", f"Plant {plant_name} not found in simulation data"
+    )
 
 
 def check_water_tank_level() -> Dict[str, Any]:
@@ -54,27 +73,27 @@ def check_water_tank_level() -> Dict[str, Any]:
         return {
             "level_percentage": tank_data.get("level_percentage", 0),
             "capacity_liters": tank_data.get("capacity_liters", 0),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "success",
         }
 
     try:
-        url = f"{iot_config.base_url}/api/water-tank"
-        response = requests.get(url, timeout=iot_config.sensor_timeout)
+        url = TANK_URL
+        response = http_session.get(url, timeout=iot_config.sensor_timeout)
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         return {
             "level_percentage": data.get("level", 0),
             "capacity_liters": data.get("capacity", 0),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "success",
         }
-    except requests.RequestException as e:
+    except (requests.RequestException, JSONDecodeError) as e:
         logger.error(f"Error reading water tank level: {e}")
         return {
             "level_percentage": None,
             "capacity_liters": None,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "error",
             "error": str(e),
         }
@@ -88,30 +107,30 @@ def get_sensor_history(plant_name: str, hours: int = 24) -> Dict[str, Any]:
             "plant": plant_name,
             "history": history,
             "hours_analyzed": hours,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "success",
         }
 
     try:
-        url = f"{iot_config.base_url}/api/sensors/{plant_name}/history"
+        url = SENSORS_URL_PREFIX + plant_name + HISTORY_URL_SUFFIX
         params = {"hours": hours}
-        response = requests.get(url, params=params, timeout=iot_config.sensor_timeout)
+        response = http_session.get(url, params=params, timeout=iot_config.sensor_timeout)
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         return {
             "plant": plant_name,
             "history": data.get("history", []),
             "hours_analyzed": hours,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "success",
         }
-    except requests.RequestException as e:
+    except (requests.RequestException, JSONDecodeError) as e:
         logger.error(f"Error reading sensor history for {plant_name}: {e}")
         return {
             "plant": plant_name,
             "history": [],
             "hours_analyzed": hours,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "error",
             "error": str(e),
         }
@@ -1,11 +1,23 @@
-﻿from datetime import datetime
-from typing import Dict, Any
+﻿from typing import Dict, Any
 import logging
 import requests
 from irrigation_agent.config import weather_config
+from irrigation_agent.utils.cache_utils import ttl_cache, is_success
+from irrigation_agent.utils.json_utils import loads as json_loads, JSONDecodeError
+from irrigation_agent.utils.time_utils import now_iso
+from ._base import http_session
 
 logger = logging.getLogger(__name__)
 
+# OpenWeatherMap forecasts move on a ~10 minute timescale.
+WEATHER_CACHE_TTL_SECONDS = 600
+
+
+@ttl_cache(
+    WEATHER_CACHE_TTL_SECONDS,
+    key=lambda days=3: (days, weather_config.location),
+    cache_if=is_success,
+)
 def get_weather_forecast(days: int = 3) -> Dict[str, Any]:
     """Fetch weather forecast from OpenWeatherMap API.
 
@@ -18,7 +30,7 @@ def get_weather_forecast(days: int = 3) -> Dict[str, Any]:
             "forecast": [],
             "days": days,
             "location": weather_config.location,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "error",
             "error": "API key not configured",
         }
@@ -30,9 +42,9 @@ def get_weather_forecast(days: int = 3) -> Dict[str, Any]:
             "units": "metric",
             "cnt": days * 8,
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = http_session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         forecast = []
         for item in data.get("list", []):
             forecast.append(
@@ -48,16 +60,16 @@ def get_weather_forecast(days: int = 3) -> Dict[str, Any]:
             "forecast": forecast,
             "days": days,
             "location": weather_config.location,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "success",
         }
-    except requests.RequestException as e:
+    except (requests.RequestException, JSONDecodeError) as e:
         logger.error(f"Error fetching weather forecast: {e}")
         return {
             "forecast": [],
             "days": days,
             "location": weather_config.location,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "status": "error",
             "error": str(e),
         }
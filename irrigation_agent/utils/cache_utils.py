@@ -0,0 +1,96 @@
+"""Small in-process caching helpers."""
+
+import functools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def ttl_cache(
+    ttl_seconds: float,
+    key: Optional[Callable[..., Any]] = None,
+    cache_if: Optional[Callable[[Any], bool]] = None,
+    maxsize: int = 256,
+) -> Callable:
+    """Cache a function's results in memory for ``ttl_seconds``.
+
+    Args:
+        ttl_seconds: How long a cached result stays valid.
+        key: Builds the cache key from the call arguments; defaults to the
+            positional and keyword arguments themselves.
+        cache_if: Predicate on the result; results failing it (e.g. error
+            payloads) are returned but not stored.
+        maxsize: Upper bound on stored entries; the oldest are evicted first.
+
+    Concurrent misses on the same key are coalesced: one caller computes the
+    value and everyone who arrived while it ran gets that same outcome, even
+    an uncached error result or exception, instead of retrying one by one.
+    Cached values are shared between callers, so treat them as read-only.
+    The wrapped function gains a ``cache_clear()`` method.
+    """
+    def decorator(func: Callable) -> Callable:
+        entries: Dict[Any, Tuple[float, Any]] = {}
+        inflight: Dict[Any, Future] = {}
+        lock = threading.Lock()
+
+        def fresh(cache_key: Any) -> Tuple[bool, Any]:
+            # Caller holds ``lock``
+            entry = entries.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                return True, entry[1]
+            return False, None
+
+        def store(cache_key: Any, result: Any) -> None:
+            # Caller holds ``lock``
+            now = time.monotonic()
+            entries.pop(cache_key, None)
+            entries[cache_key] = (now + ttl_seconds, result)
+            if len(entries) > maxsize:
+                for stale in [k for k, (exp, _) in entries.items() if exp <= now]:
+                    del entries[stale]
+                while len(entries) > maxsize:
+                    del entries[next(iter(entries))]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            with lock:
+                hit, value = fresh(cache_key)
+                if hit:
+                    return value
+                future = inflight.get(cache_key)
+                owner = future is None
+                if owner:
+                    future = inflight[cache_key] = Future()
+            if not owner:
+                return future.result()
+
+            try:
+                result = func(*args, **kwargs)
+                cacheable = cache_if is None or cache_if(result)
+            except BaseException as e:
+                with lock:
+                    del inflight[cache_key]
+                future.set_exception(e)
+                raise
+            with lock:
+                if cacheable:
+                    store(cache_key, result)
+                del inflight[cache_key]
+            future.set_result(result)
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def is_success(result: Any) -> bool:
+    """``cache_if`` predicate for the ``{"status": "success", ...}`` payloads used by tools."""
+    return isinstance(result, dict) and result.get("status") == "success"
@@ -1,19 +1,20 @@
-﻿import json
-import re
+﻿import asyncio
+import json
 import threading
 from typing import Any, Optional, Tuple
 
-try:
-    from ..config import config
-except Exception:
-    from irrigation_agent.config import config  # type: ignore
+from irrigation_agent.utils.json_utils import loads as json_loads, dumps as json_dumps, JSONDecodeError
 
 _client_lock = threading.Lock()
 _client_instance = None
 
 
 def get_genai_client():
-    """Return a singleton google.genai Client configured for Vertex AI if enabled."""
+    """Return a singleton google.genai Client configured for Vertex AI if enabled.
+
+    After the first call this is a plain global read; the lock is only taken
+    on the cold path. The API warms it at startup (see ``main.lifespan``).
+    """
     global _client_instance
     if _client_instance is not None:
         return _client_instance
@@ -25,48 +26,136 @@ def get_genai_client():
     return _client_instance
 
 
+async def generate_content_async(client: Any, **kwargs: Any) -> Any:
+    """Await ``client.models.generate_content(**kwargs)`` without blocking the event loop.
+
+    Uses the client's native async surface (``client.aio``) when present and
+    otherwise runs the sync call in a worker thread.
+    """
+    aio = getattr(client, "aio", None)
+    if aio is not None:
+        return await aio.models.generate_content(**kwargs)
+    return await asyncio.to_thread(client.models.generate_content, **kwargs)
+
+
+async def generate_json_text_async(client: Any, **kwargs: Any) -> str:
+    """Stream a reply whose payload is one JSON object and return its text.
+
+    Stops reading (and closes the stream) as soon as the first top-level
+    object is complete, so trailing prose or fences aren't waited for, and
+    returns just that object. Otherwise returns the whole reply text. Falls
+    back to ``generate_content_async`` when streaming isn't available.
+    """
+    aio = getattr(client, "aio", None)
+    stream_fn = getattr(getattr(aio, "models", None), "generate_content_stream", None)
+    if stream_fn is None:
+        return extract_text(await generate_content_async(client, **kwargs))
+
+    stream = await stream_fn(**kwargs)
+    parts = []
+    try:
+        async for chunk in stream:
+            parts.append(extract_text(chunk))
+            if "}" in parts[-1]:
+                text = "".join(parts)
+                span = _json_object_span(text)
+                if span is not None:
+                    return text[span[0]:span[1]]
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return "".join(parts)
+
+
+def _json_object_span(text: str) -> Optional[Tuple[int, int]]:
+    """(start, end) of the first complete top-level JSON object in ``text``.
+
+    Single forward scan matching braces, ignoring those inside string literals.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
+
+def prompt_json(obj: Any) -> str:
+    """Render context data for a prompt as compact JSON rather than Python repr.
+
+    JSON is cheaper to build than a recursive repr and costs the model fewer
+    tokens. Values orjson can't encode fall back to their ``str()``.
+    """
+    try:
+        return json_dumps(obj)
+    except TypeError:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
 def extract_text(response: Any) -> str:
     """Extract text from google.genai response across common shapes."""
     if response is None:
         return ""
-    if hasattr(response, "text") and isinstance(response.text, str):
-        return response.text
-    text = ""
-    try:
-        candidates = getattr(response, "candidates", []) or []
-        for cand in candidates:
-            content = getattr(cand, "content", None)
-            if content and hasattr(content, "parts"):
-                for part in content.parts:
-                    t = getattr(part, "text", None)
-                    if isinstance(t, str):
-                        text += t
-    except Exception:
-        pass
-    return text
+    text = getattr(response, "text", None)
+    if isinstance(text, str):
+        return text
+    # Multi-part replies: one flat pass over candidates -> content -> parts,
+    # joined once. Missing or None levels (e.g. parts=None on blocked
+    # candidates) are skipped rather than caught.
+    return "".join([
+        t
+        for cand in getattr(response, "candidates", None) or ()
+        for part in getattr(getattr(cand, "content", None), "parts", None) or ()
+        if isinstance(t := getattr(part, "text", None), str)
+    ])
 
 
 def extract_json_object(text: str) -> Tuple[Optional[dict], str]:
-    """Try to parse a JSON object from text, handling code fences.
+    """Try to parse a JSON object from text, handling code fences and prose.
 
     Returns (obj, raw_text). obj is None if parsing fails.
     """
     if not text:
         return None, ""
 
-    # Strip markdown code block if present
-    match = re.search(r"```(?:json)?\s*(\{[\s\S]*?\})\s*```", text, re.DOTALL)
-    if match:
-        text = match.group(1)
-
     cleaned = text.strip()
-    try:
-        obj = json.loads(cleaned)
-        if isinstance(obj, dict):
-            return obj, cleaned
-    except json.JSONDecodeError:
-        pass
-    return None, cleaned
-
-
+    # Most replies are the bare object; try that before scanning.
+    if cleaned.startswith("{"):
+        try:
+            obj = json_loads(cleaned)
+            if isinstance(obj, dict):
+                return obj, cleaned
+        except JSONDecodeError:
+            pass
 
+    # Otherwise take the first balanced {...} (inside a fence or after a
+    # preamble), found by one forward brace scan.
+    span = _json_object_span(cleaned)
+    if span is not None:
+        candidate = cleaned[span[0]:span[1]]
+        try:
+            obj = json_loads(candidate)
+            if isinstance(obj, dict):
+                return obj, candidate
+        except JSONDecodeError:
+            pass
+    return None, cleaned
@@ -0,0 +1,24 @@
+"""Timestamp helpers shared by the tool and service layers."""
+
+import time
+from datetime import datetime
+
+
+# (epoch second, ISO string) swapped as one tuple so readers never see a
+# half-updated pair without needing a lock.
+_ts_cache = (0, "")
+
+
+def now_iso() -> str:
+    """Return the current local time as an ISO-8601 string, second precision.
+
+    The formatted string is reused for every call within the same wall-clock
+    second, which keeps status loops that stamp many payloads cheap.
+    """
+    global _ts_cache
+    second = int(time.time())
+    cached = _ts_cache
+    if cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second).isoformat())
+        _ts_cache = cached
+    return cached[1]
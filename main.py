@@ -3,14 +3,17 @@ Intelligent Irrigation Agent API - Main Application
 
 """
 import os
+import json
 import logging
 import asyncio
 from contextlib import asynccontextmanager
-from datetime import datetime
-from functools import partial
 
-from fastapi import FastAPI, HTTPException, WebSocket
+from fastapi import FastAPI, HTTPException, Response, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from api.dependencies import get_tools_available, get_config
+from api.utils import ORJSON_AVAILABLE, now_iso
 
 # Configure logging for Cloud Run
 logging.basicConfig(
@@ -19,17 +22,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Try to import irrigation_agent modules, but don't fail if they're not available
-try:
-    from irrigation_agent.tools import get_system_status
-    from irrigation_agent.config import config
-    TOOLS_AVAILABLE = True
-    logger.info("Irrigation agent tools loaded successfully")
-except Exception as e:
-    TOOLS_AVAILABLE = False
-    config = None
-    logger.warning(f"Could not load irrigation agent tools: {e}")
-    logger.info("API will run in limited mode without irrigation tools")
+# Guarded, once-per-process import of irrigation_agent (see api.dependencies);
+# the API runs in limited mode if it fails
+TOOLS_AVAILABLE = get_tools_available()
+config = get_config()
+
+# Import routers
+from api.routers import plants, gardens, agriculture, audio
 
 
 @asynccontextmanager
@@ -37,6 +36,15 @@ async def lifespan(_app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
     from api.services.monitoring import monitor_system
 
+    if TOOLS_AVAILABLE:
+        # Build the GenAI client now so the first request doesn't pay for it
+        try:
+            from irrigation_agent.utils.genai_utils import get_genai_client
+            await asyncio.to_thread(get_genai_client)
+            logger.info("GenAI client initialized")
+        except Exception as e:
+            logger.warning(f"GenAI client warm-up failed, will retry on first use: {e}")
+
     task = asyncio.create_task(monitor_system(TOOLS_AVAILABLE))
     logger.info("Background monitoring task started")
     yield
@@ -51,7 +59,9 @@ app = FastAPI(
     title="Intelligent Irrigation Agent API",
     description="Multi-agent irrigation system using Google Gemini ADK",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Every dict-returning endpoint is rendered by this class
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
 )
 
 # Configure CORS
@@ -76,35 +86,45 @@ app.add_middleware(
 # ROOT AND HEALTH ENDPOINTS
 # ============================================================================
 
+def _stamped_envelope(fields: dict) -> bytes:
+    """Serialize ``fields`` once, leaving the body open for a timestamp value."""
+    return json.dumps(fields, separators=(",", ":"))[:-1].encode() + b',"timestamp":"'
+
+
+def _stamped_response(envelope: bytes) -> Response:
+    return Response(envelope + now_iso().encode() + b'"}', media_type="application/json")
+
+
+# Only the timestamp varies between calls, so the rest is serialized once
+_ROOT_ENVELOPE = _stamped_envelope({
+    "service": "Intelligent Irrigation Agent",
+    "status": "running",
+    "version": "0.1.0",
+    "docs": "/docs",
+    "health": "/health"
+})
+_HEALTH_ENVELOPE = _stamped_envelope(
+    {"status": "healthy", "tools_available": TOOLS_AVAILABLE, "config_loaded": True}
+    if TOOLS_AVAILABLE else
+    {"status": "healthy", "tools_available": TOOLS_AVAILABLE}
+)
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API information."""
-    return {
-        "service": "Intelligent Irrigation Agent",
-        "status": "running",
-        "version": "0.1.0",
-        "timestamp": datetime.now().isoformat(),
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return _stamped_response(_ROOT_ENVELOPE)
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint for Cloud Run."""
     try:
-        health_status = {
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "tools_available": TOOLS_AVAILABLE
-        }
-
         if TOOLS_AVAILABLE:
             # Verify configuration is loaded
             _ = config.worker_model
-            health_status["config_loaded"] = True
 
-        return health_status
+        return _stamped_response(_HEALTH_ENVELOPE)
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=503, detail=str(e))
@@ -117,8 +137,8 @@ async def api_system_status():
         raise HTTPException(status_code=503, detail="Irrigation tools not available")
 
     try:
-        status = get_system_status()
-        return status
+        from api.services.cache import get_cached_status
+        return await get_cached_status()
     except Exception as e:
         logger.error(f"Error getting system status: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -133,28 +153,39 @@ async def api_trigger_monitoring():
     try:
         logger.info("Manual monitoring trigger requested")
 
-        from irrigation_agent.tools import get_all_gardens_status
+        from api.services.cache import get_cached_gardens_status
         from api.services.monitoring import process_garden_monitoring
         from api.websocket import manager
 
-        # Get status for all gardens
-        gardens_status = get_all_gardens_status()
+        # Shared with the monitor loop, so a trigger right after a tick
+        # doesn't repeat the sweep (blocking reads run off the loop)
+        gardens_status = await get_cached_gardens_status()
 
         if gardens_status.get("status") != "success":
             raise HTTPException(status_code=500, detail=gardens_status.get("error"))
 
-        alerts = []
-        decisions = []
-
-        for garden_id, garden_data in gardens_status.get("gardens", {}).items():
-            garden_alerts, garden_decisions = await process_garden_monitoring(
+        # Gardens are independent, so process them concurrently; one garden
+        # failing must not discard the others' results
+        garden_ids = list(gardens_status.get("gardens", {}))
+        results = await asyncio.gather(*(
+            process_garden_monitoring(
                 garden_id,
-                garden_data,
+                gardens_status["gardens"][garden_id],
                 manager,
                 TOOLS_AVAILABLE,
                 config,
                 collect_results=True
             )
+            for garden_id in garden_ids
+        ), return_exceptions=True)
+
+        alerts = []
+        decisions = []
+        for garden_id, result in zip(garden_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error monitoring garden {garden_id}: {result}")
+                continue
+            garden_alerts, garden_decisions = result
             alerts.extend(garden_alerts)
             decisions.extend(garden_decisions)
 
@@ -164,7 +195,7 @@ async def api_trigger_monitoring():
             "decisions_made": len(decisions),
             "alerts": alerts,
             "decisions": decisions,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
     except Exception as e:
@@ -187,31 +218,8 @@ async def websocket_route(websocket: WebSocket, device_id: str):
 # REGISTER ROUTERS
 # ============================================================================
 
-# Import routers
-from api.routers import plants, gardens, agriculture, audio
-
-# Create partial functions to inject dependencies into routers
-# This allows routers to access TOOLS_AVAILABLE and config without global imports
-def inject_dependencies(router_module):
-    """Inject TOOLS_AVAILABLE and config into router endpoints."""
-    for route in router_module.router.routes:
-        if hasattr(route, 'endpoint'):
-            # Add default values for tools_available and config parameters
-            endpoint = route.endpoint
-            if 'tools_available' in endpoint.__code__.co_varnames:
-                # Use partial to inject TOOLS_AVAILABLE as default
-                route.endpoint = partial(endpoint, tools_available=TOOLS_AVAILABLE)
-            if 'config' in endpoint.__code__.co_varnames:
-                # Use partial to inject config as default
-                route.endpoint = partial(endpoint, config=config)
-
-# Apply dependency injection
-inject_dependencies(plants)
-inject_dependencies(gardens)
-inject_dependencies(agriculture)
-inject_dependencies(audio)
-
-# Register all routers
+# Register all routers; they read TOOLS_AVAILABLE and config through
+# api.dependencies (Depends)
 app.include_router(plants.router)
 app.include_router(gardens.router)
 app.include_router(agriculture.router)
@@ -225,11 +233,19 @@ logger.info("All routers registered successfully")
 # ============================================================================
 
 if __name__ == "__main__":
+    from importlib.util import find_spec
+
     import uvicorn
 
     # Get port from environment (Cloud Run sets PORT)
     port = int(os.environ.get("PORT", 8080))
 
+    # uvloop/httptools come with uvicorn[standard]; fall back to the stdlib
+    # loop and h11 where they aren't installed (e.g. Windows dev machines)
+    loop = os.environ.get("UVICORN_LOOP") or ("uvloop" if find_spec("uvloop") else "asyncio")
+    http = os.environ.get("UVICORN_HTTP") or ("httptools" if find_spec("httptools") else "h11")
+    ws = os.environ.get("UVICORN_WS", "websockets")
+
     # Start server
-    logger.info(f"Starting Intelligent Irrigation Agent API on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    logger.info(f"Starting Intelligent Irrigation Agent API on port {port} (loop={loop}, http={http}, ws={ws})")
+    uvicorn.run(app, host="0.0.0.0", port=port, loop=loop, http=http, ws=ws)
@@ -5,13 +5,16 @@ Contains all system prompts as Python template strings for better maintainabilit
 and IDE support.
 """
 
-from .agent_decision import AGENT_DECISION_PROMPT
+from .agent_decision import AGENT_SYSTEM_PROMPT, AGENT_DECISION_PROMPT
+from .agent_batch_decision import AGENT_BATCH_DECISION_PROMPT
 from .garden_chat import GARDEN_CHAT_PROMPT
 from .garden_advisor import GARDEN_ADVISOR_PROMPT
 from .websocket_chat import WEBSOCKET_CHAT_PROMPT
 
 __all__ = [
+    "AGENT_SYSTEM_PROMPT",
     "AGENT_DECISION_PROMPT",
+    "AGENT_BATCH_DECISION_PROMPT",
     "GARDEN_CHAT_PROMPT",
     "GARDEN_ADVISOR_PROMPT",
     "WEBSOCKET_CHAT_PROMPT",
@@ -0,0 +1,22 @@
+"""
+Batched agent decision prompt for irrigation actions.
+
+Used by agent_analyze_and_act_batch() to decide for several critical plants
+of the same garden in a single model call. Sent with AGENT_SYSTEM_PROMPT as
+the system instruction, which defines the decision object.
+"""
+
+AGENT_BATCH_DECISION_PROMPT = """JARDIN: '{garden_name}'
+PERSONALIDAD DEL JARDIN: {personality}
+
+SITUACIONES ACTUALES (una por planta, numeradas):
+{plants}
+
+Incluye exactamente una decision por planta, con su numero en "index" y su plant_id tal como aparecen arriba.
+
+Responde en formato JSON con esta estructura:
+{{
+    "decisions": [
+        {{"index": 1, "decision": "...", "plant_id": "...", "garden_id": "...", "action_params": {{}}, "explanation": "...", "priority": "..."}}
+    ]
+}}"""